@@ -16,6 +16,7 @@ from typing import Any, Optional
 
 from agents.training.base import DataGenerator, SourceItem, TrainingSample
 from agents.training.json_utils import extract_json_from_response
+from hafs_scawful.generators.prefilter import asm_prefilter_reason
 from agents.knowledge.asm_preprocessor import AsmPreprocessor
 
 logger = logging.getLogger(__name__)
@@ -176,7 +177,7 @@ class AsmBaseGenerator(DataGenerator):
             for m in item.memory_access:
                 kg_entities.append(str(m) if not isinstance(m, str) else m)
 
-            return TrainingSample(
+            sample = TrainingSample(
                 instruction=instruction,
                 input=input_text,
                 output=output,
@@ -187,6 +188,14 @@ class AsmBaseGenerator(DataGenerator):
                 kg_entities=kg_entities,
             )
 
+            # Drop malformed responses before the quality pipeline scores them
+            reason = asm_prefilter_reason(sample)
+            if reason:
+                logger.debug(f"[{self.TASK_TYPE}] Prefilter dropped {item.name}: {reason}")
+                return None
+
+            return sample
+
         except asyncio.TimeoutError:
             logger.warning(f"[{self.TASK_TYPE}] Timeout for {item.name}")
             return None
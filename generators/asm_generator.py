@@ -15,6 +15,7 @@ from typing import Any, Optional
 
 from agents.training.base import DataGenerator, SourceItem, TrainingSample
 from agents.training.json_utils import extract_json_from_response
+from hafs_scawful.generators.prefilter import asm_prefilter_reason
 from hafs_scawful.generators.prompt_templates import PromptTemplateRotator
 from agents.knowledge.asm_preprocessor import AsmPreprocessor
 from config.prompts import get_prompt
@@ -169,6 +170,13 @@ class AsmDataGenerator(DataGenerator):
             try:
                 with open(master_lib, 'r') as f:
                     scanned = json.load(f)
+                    if isinstance(scanned, dict):
+                        # Deduplicated layout: unique bodies + per-occurrence refs
+                        bodies = scanned["bodies"]
+                        scanned = [
+                            {"name": o["name"], "file": o["file"], "code": bodies[o["hash"]]}
+                            for o in scanned["occurrences"]
+                        ]
                     for item in scanned:
                         items.append(AsmSourceItem(
                             name=item['name'],
@@ -355,6 +363,12 @@ class AsmDataGenerator(DataGenerator):
                 output = self._preprocessor.enrich(output)
                 sample.output = output
 
+            # Drop malformed responses before Asar and the quality pipeline
+            reason = asm_prefilter_reason(sample)
+            if reason:
+                logger.debug(f"Prefilter dropped {item.name}: {reason}")
+                return None
+
             # Validate ASM syntax
             if hasattr(self, "_asar_validator") and self._asar_validator:
                 val_result = await self._asar_validator.validate(sample)
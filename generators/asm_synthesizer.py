@@ -12,8 +12,10 @@ Target: Compare sample quality across euclid-asm task types
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
+import math
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -21,8 +23,68 @@ from typing import Any, Optional
 
 from agents.training.base import TrainingSample
 
+try:
+    import orjson  # Optional: faster serialization for large dumps
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Samples buffered per type before they are appended to its JSONL file
+FLUSH_EVERY = 20
+
+
+def _sample_key(sample: TrainingSample) -> bytes:
+    """Dedup key: blake2b-128 of whitespace/case-normalized sample text."""
+    text = "\0".join((sample.instruction, sample.input, sample.output))
+    normalized = " ".join(text.lower().split())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+
+def _dumps_line(data: dict) -> bytes:
+    """Serialize one JSONL record (newline included)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data) + '\n').encode()
+
+
+def _write_lines(path: Path, lines: list[bytes], append: bool = False) -> None:
+    """Write (or append) pre-serialized JSONL lines in a single call."""
+    with open(path, 'ab' if append else 'wb') as f:
+        f.write(b"".join(lines))
+
+
+def _merge_jsonl(type_files: list[Path], merged_file: Path) -> int:
+    """Concatenate per-type JSONL files; returns the merged line count."""
+    total = 0
+    with open(merged_file, 'wb') as out:
+        for type_file in type_files:
+            if type_file.exists():
+                with open(type_file, 'rb') as f:
+                    for line in f:
+                        out.write(line)
+                        total += 1
+    return total
+
+
+@dataclass
+class RunningStats:
+    """Online mean/std (Welford), O(1) memory regardless of sample count."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
 
 @dataclass
 class GeneratorComparison:
@@ -54,6 +116,7 @@ class SynthesisResult:
     samples_by_type: dict[str, int] = field(default_factory=dict)
     success_rates: dict[str, float] = field(default_factory=dict)
     avg_quality: dict[str, float] = field(default_factory=dict)
+    quality_std: dict[str, float] = field(default_factory=dict)
     comparisons: list[GeneratorComparison] = field(default_factory=list)
     duration_seconds: float = 0.0
 
@@ -70,7 +133,11 @@ class SynthesisResult:
         for task, count in sorted(self.samples_by_type.items()):
             rate = self.success_rates.get(task, 0) * 100
             quality = self.avg_quality.get(task, 0)
-            lines.append(f"  {task}: {count} samples ({rate:.1f}% success, {quality:.2f} avg quality)")
+            std = self.quality_std.get(task, 0)
+            lines.append(
+                f"  {task}: {count} samples ({rate:.1f}% success, "
+                f"{quality:.2f} ± {std:.2f} avg quality)"
+            )
 
         return "\n".join(lines)
 
@@ -213,16 +280,20 @@ class AsmSynthesizer:
         items = items[:limit]
 
         result = SynthesisResult(total_items=len(items))
+        quality_stats = {gen_type: RunningStats() for gen_type in self.generators}
 
         for i, item in enumerate(items):
             logger.info(f"Processing {i+1}/{len(items)}: {item.name}")
             comparison = await self.compare_on_item(item)
             result.comparisons.append(comparison)
 
-            # Update counts
+            # Update counts and running quality stats (failed samples score 0, skipped)
             for gen_type, sample in comparison.samples.items():
                 if sample:
                     result.samples_by_type[gen_type] = result.samples_by_type.get(gen_type, 0) + 1
+            for gen_type, quality in comparison.quality_scores.items():
+                if quality:
+                    quality_stats[gen_type].add(quality)
 
         # Calculate success rates and average quality
         for gen_type in self.generators.keys():
@@ -230,8 +301,8 @@ class AsmSynthesizer:
             successes = result.samples_by_type.get(gen_type, 0)
             result.success_rates[gen_type] = successes / total if total > 0 else 0
 
-            qualities = [c.quality_scores.get(gen_type, 0) for c in result.comparisons if c.quality_scores.get(gen_type)]
-            result.avg_quality[gen_type] = sum(qualities) / len(qualities) if qualities else 0
+            result.avg_quality[gen_type] = quality_stats[gen_type].mean
+            result.quality_std[gen_type] = quality_stats[gen_type].std
 
         result.duration_seconds = time.time() - start_time
         return result
@@ -260,6 +331,10 @@ class AsmSynthesizer:
         include_types = include_types or list(self.generators.keys())
         counts = {}
 
+        # Dedup at emission time: only 16-byte digests are retained
+        seen: set[bytes] = set()
+        duplicates = 0
+
         # Generate samples for each type
         for gen_type in include_types:
             if gen_type not in self.generators:
@@ -275,9 +350,13 @@ class AsmSynthesizer:
             items = items[:limit_per_type]
 
             output_file = output_dir / f"asm_{gen_type}.jsonl"
+            pending: list[bytes] = []
             sample_count = 0
 
-            with open(output_file, 'w') as f:
+            # Samples are appended every FLUSH_EVERY lines, off the event
+            # loop, so an interrupted run keeps what it already generated
+            await asyncio.to_thread(_write_lines, output_file, [])
+            try:
                 for i, item in enumerate(items):
                     if i % 50 == 0:
                         logger.info(f"[{gen_type}] Progress: {i}/{len(items)}")
@@ -285,28 +364,35 @@ class AsmSynthesizer:
                     try:
                         sample = await generator.generate_sample(item)
                         if sample:
-                            f.write(json.dumps(sample.to_dict()) + '\n')
-                            sample_count += 1
+                            key = _sample_key(sample)
+                            if key in seen:
+                                duplicates += 1
+                                continue
+                            seen.add(key)
+                            pending.append(_dumps_line(sample.to_dict()))
                     except Exception as e:
                         logger.warning(f"[{gen_type}] Failed on {item.name}: {e}")
 
+                    if len(pending) >= FLUSH_EVERY:
+                        await asyncio.to_thread(_write_lines, output_file, pending, True)
+                        sample_count += len(pending)
+                        pending = []
+            finally:
+                if pending:
+                    await asyncio.to_thread(_write_lines, output_file, pending, True)
+                    sample_count += len(pending)
+
             counts[gen_type] = sample_count
             logger.info(f"[{gen_type}] Generated {sample_count} samples -> {output_file}")
 
         # Also create merged file
         merged_file = output_dir / "asm_all_types.jsonl"
-        total = 0
-        with open(merged_file, 'w') as out:
-            for gen_type in include_types:
-                type_file = output_dir / f"asm_{gen_type}.jsonl"
-                if type_file.exists():
-                    with open(type_file, 'r') as f:
-                        for line in f:
-                            out.write(line)
-                            total += 1
-
-        logger.info(f"Merged {total} samples -> {merged_file}")
+        type_files = [output_dir / f"asm_{gen_type}.jsonl" for gen_type in include_types]
+        total = await asyncio.to_thread(_merge_jsonl, type_files, merged_file)
+
+        logger.info(f"Merged {total} samples -> {merged_file} ({duplicates} duplicates dropped)")
         counts['_merged'] = total
+        counts['_duplicates'] = duplicates
 
         return counts
 
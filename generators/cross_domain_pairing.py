@@ -0,0 +1,89 @@
+"""Bucketed pairing of vanilla ASM routines with Oracle routines.
+
+Cross-domain samples (ASM+Oracle) need related routine pairs. Instead of
+scoring every vanilla routine against every Oracle routine, both sides are
+keyed by a canonical routine name and only items sharing a bucket are
+paired: O(n + sum of bucket sizes squared) instead of O(n * m).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from typing import Any, Iterable, Optional
+
+_HACK_PREFIX_RE = re.compile(r"^(?:oracle|oos|hook|new|custom)_+", re.IGNORECASE)
+_LONG_SUFFIX_RE = re.compile(r"_+(?:long|l)$", re.IGNORECASE)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+
+def canonical_routine_name(name: str) -> str:
+    """Normalize a routine name so vanilla labels and hack hooks share a key.
+
+    "Oracle_Sprite_Main_long" and "Sprite_Main" both map to "spritemain".
+    """
+    name = _HACK_PREFIX_RE.sub("", name.strip())
+    name = _LONG_SUFFIX_RE.sub("", name)
+    return _NON_ALNUM_RE.sub("", name.lower())
+
+
+def _asm_key(item: Any) -> str:
+    return canonical_routine_name(getattr(item, "label", "") or item.name)
+
+
+def _oracle_keys(item: Any) -> list[str]:
+    """Candidate keys, strongest first: hooked vanilla routine, own name, calls."""
+    names = [getattr(item, "hooks_vanilla", None) or "", item.name]
+    names.extend(getattr(item, "calls", []))
+    keys: list[str] = []
+    for name in names:
+        key = canonical_routine_name(name) if name else ""
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+def build_buckets(asm_items: Iterable[Any]) -> dict[str, list[Any]]:
+    """Group vanilla ASM items by canonical routine name."""
+    buckets: dict[str, list[Any]] = defaultdict(list)
+    for item in asm_items:
+        key = _asm_key(item)
+        if key:
+            buckets[key].append(item)
+    return buckets
+
+
+def pair_cross_domain(
+    asm_items: Iterable[Any],
+    oracle_items: Iterable[Any],
+    limit: Optional[int] = None,
+    per_oracle: int = 1,
+) -> list[tuple[Any, Any]]:
+    """Pair Oracle routines with vanilla routines sharing a canonical name.
+
+    Args:
+        asm_items: Vanilla items (label or name used as key)
+        oracle_items: Oracle items (hooks_vanilla, name, calls used as keys)
+        limit: Maximum pairs to return (None = all)
+        per_oracle: Maximum vanilla partners per Oracle routine
+
+    Returns:
+        List of (asm_item, oracle_item) pairs
+    """
+    buckets = build_buckets(asm_items)
+    pairs: list[tuple[Any, Any]] = []
+
+    for oracle_item in oracle_items:
+        matched = 0
+        for key in _oracle_keys(oracle_item):
+            for asm_item in buckets.get(key, ()):
+                pairs.append((asm_item, oracle_item))
+                matched += 1
+                if limit is not None and len(pairs) >= limit:
+                    return pairs
+                if matched >= per_oracle:
+                    break
+            if matched >= per_oracle:
+                break
+
+    return pairs
@@ -17,6 +17,8 @@ from typing import Any, Optional
 from agents.training.base import DataGenerator, SourceItem, TrainingSample
 from agents.training.json_utils import extract_json_from_response
 from hafs_scawful.generators.prompt_templates import PromptTemplateRotator
+from hafs_scawful.generators.resource_index import load_resource_index
+from hafs_scawful.generators.source_cache import SourceItemCache
 from agents.training.resource_discovery import ZeldaResourceIndexer
 from config.prompts import get_prompt
 
@@ -140,14 +142,8 @@ class DocumentationGenerator(DataGenerator):
         """Initialize resources and index documentation files."""
         await super().setup()
 
-        # Initialize resource indexer
-        self._indexer = ZeldaResourceIndexer()
-
-        # Load or build index
-        index_result = self._indexer.load_index()
-        if not index_result:
-            logger.info("Building documentation resource index...")
-            index_result = await self._indexer.discover_and_index()
+        # Load or build the resource index (shared with other generators)
+        self._indexer, index_result = await load_resource_index()
 
         logger.info(f"Documentation index loaded: {index_result.total_files} files")
 
@@ -175,13 +171,24 @@ class DocumentationGenerator(DataGenerator):
 
         logger.info(f"Found {len(doc_files)} documentation files to process")
 
+        # Skip re-parsing files unchanged since the last run
+        cache = SourceItemCache(
+            f"documentation_sections_{self.min_section_length}", DocumentationSourceItem
+        )
+        cache.load()
+
         for resource_file in doc_files:
             try:
-                file_items = await self._extract_sections_from_file(resource_file.path)
+                key, file_items = cache.lookup(resource_file.path)
+                if file_items is None:
+                    file_items = await self._extract_sections_from_file(resource_file.path)
+                    cache.store(resource_file.path, key, file_items)
                 items.extend(file_items)
             except Exception as e:
                 logger.error(f"Error processing {resource_file.path}: {e}")
 
+        cache.save()
+
         logger.info(f"Extracted {len(items)} documentation sections")
         return items
 
@@ -15,6 +15,7 @@ from typing import Any, Optional
 
 from agents.training.base import DataGenerator, SourceItem, TrainingSample
 from agents.training.json_utils import extract_json_from_response
+from hafs_scawful.generators.prefilter import asm_prefilter_reason
 from hafs_scawful.generators.prompt_templates import PromptTemplateRotator
 from config.prompts import get_prompt
 
@@ -365,7 +366,7 @@ class OracleDataGenerator(DataGenerator):
                 kg_entities.append(str(item.hooks_vanilla))
             kg_entities.extend([str(c) for c in item.calls[:3]])  # Top 3 calls
 
-            return TrainingSample(
+            sample = TrainingSample(
                 instruction=instruction,
                 input=input_text,
                 output=output,
@@ -376,6 +377,14 @@ class OracleDataGenerator(DataGenerator):
                 kg_entities=kg_entities,
             )
 
+            # Drop malformed responses before the quality pipeline scores them
+            reason = asm_prefilter_reason(sample)
+            if reason:
+                logger.debug(f"Prefilter dropped {item.name}: {reason}")
+                return None
+
+            return sample
+
         except asyncio.TimeoutError:
             logger.warning(f"Timeout generating for {item.name}")
             return None
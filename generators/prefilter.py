@@ -0,0 +1,46 @@
+"""Cheap structural checks for generated ASM samples.
+
+Run before the expensive quality pipeline (and before Asar validation) so
+obviously malformed teacher responses are dropped early instead of being
+fully scored and then rejected.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+from agents.training.base import TrainingSample
+
+# Common 65816 mnemonics; any one of them as a token means the output has code
+_OPCODE_RE = re.compile(
+    r"\b(?:LDA|LDX|LDY|STA|STX|STY|STZ|JSR|JSL|JMP|JML|RTS|RTL|RTI|"
+    r"BRA|BEQ|BNE|BCC|BCS|BPL|BMI|CMP|CPX|CPY|REP|SEP|PHA|PLA|PHB|PLB|"
+    r"PHP|PLP|INC|DEC|INX|INY|DEX|DEY|ADC|SBC|AND|ORA|EOR|ASL|LSR|"
+    r"TAX|TAY|TXA|TYA|CLC|SEC|BIT|MVN|MVP)\b",
+    re.IGNORECASE,
+)
+
+MIN_INSTRUCTION_CHARS = 15
+MIN_OUTPUT_CHARS = 80
+# Keep above AsmValidator.OFFLOAD_MIN_CHARS so large accepted outputs are
+# still parsed in a worker process
+MAX_OUTPUT_CHARS = 20_000
+
+
+def asm_prefilter_reason(sample: TrainingSample) -> Optional[str]:
+    """Return why an ASM sample fails the cheap checks, or None if it passes."""
+    if len(sample.instruction.strip()) < MIN_INSTRUCTION_CHARS:
+        return "instruction too short"
+
+    output = sample.output
+    if len(output) < MIN_OUTPUT_CHARS:
+        return "output too short"
+    if len(output) > MAX_OUTPUT_CHARS:
+        return "output too long"
+    if output.count("```") % 2:
+        return "unbalanced code fence"
+    if not _OPCODE_RE.search(output):
+        return "no 65816 opcodes in output"
+
+    return None
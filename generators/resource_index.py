@@ -0,0 +1,62 @@
+"""Process-wide shared Zelda resource index.
+
+The zelda3 and documentation generators both read the same on-disk index
+written by ZeldaResourceIndexer. Loading it through here parses the index
+once per process (keyed by the index file's mtime, so a rebuild is picked
+up) instead of once per generator setup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import weakref
+from typing import Any
+
+from agents.training.resource_discovery import ZeldaResourceIndexer
+
+logger = logging.getLogger(__name__)
+
+# index_path -> (mtime_ns when loaded, indexer, index result)
+_SHARED: dict[str, tuple[int, ZeldaResourceIndexer, Any]] = {}
+# One lock per event loop (scripts may call asyncio.run more than once);
+# weakly keyed so a closed loop's lock goes away with the loop
+_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _mtime_ns(path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+async def load_resource_index() -> tuple[ZeldaResourceIndexer, Any]:
+    """Return a loaded (indexer, index result), building the index if missing.
+
+    Callers share the returned indexer and must treat its files as read-only.
+    """
+    loop = asyncio.get_running_loop()
+    lock = _LOCKS.get(loop)
+    if lock is None:
+        lock = _LOCKS[loop] = asyncio.Lock()
+
+    # Generators set up concurrently: the first one loads, the rest wait
+    async with lock:
+        indexer = ZeldaResourceIndexer()
+        index_path = str(indexer.index_path)
+        cached = _SHARED.get(index_path)
+        if cached and cached[0] == _mtime_ns(index_path):
+            return cached[1], cached[2]
+
+        # Parsing the index is blocking file I/O; keep it off the event loop
+        index_result = await asyncio.to_thread(indexer.load_index)
+        if not index_result:
+            logger.info("Building Zelda resource index...")
+            index_result = await indexer.discover_and_index()
+
+        _SHARED[index_path] = (_mtime_ns(index_path), indexer, index_result)
+        return indexer, index_result
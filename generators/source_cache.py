@@ -0,0 +1,93 @@
+"""Per-file cache of extracted source items.
+
+Generators that re-parse every indexed file on each run (zelda3 disassembly,
+documentation) use this to skip files whose (path, mtime, size) is unchanged
+since the last run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path.home() / ".context" / "training" / "cache"
+
+# Bump when extraction logic changes so stale caches are discarded
+CACHE_VERSION = 1
+
+
+class SourceItemCache:
+    """JSON sidecar mapping file path -> (stat key, extracted items)."""
+
+    def __init__(self, name: str, item_cls: type, cache_dir: Optional[Path] = None):
+        """Initialize cache.
+
+        Args:
+            name: Cache file stem (include any extraction parameters)
+            item_cls: SourceItem dataclass used to rebuild cached items
+            cache_dir: Directory for cache files (default: ~/.context/training/cache)
+        """
+        self.path = (cache_dir or CACHE_DIR) / f"{name}.json"
+        self.item_cls = item_cls
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+
+    @staticmethod
+    def file_key(path: Path) -> str:
+        """Cheap change-detection key from path, mtime and size (no read)."""
+        st = os.stat(path)
+        raw = f"{path}\0{st.st_mtime_ns}\0{st.st_size}".encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def load(self) -> None:
+        """Load cache from disk; a missing or stale cache starts empty."""
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable source cache {self.path}: {e}")
+            return
+        if data.get("version") == CACHE_VERSION:
+            self._entries = data.get("files", {})
+
+    def lookup(self, path: Path) -> tuple[str, Optional[list]]:
+        """Return (key, items); items is None when the file changed or is new."""
+        key = self.file_key(path)
+        path_str = str(path)
+        self._seen.add(path_str)
+        entry = self._entries.get(path_str)
+        if entry and entry.get("key") == key:
+            self.hits += 1
+            return key, [self.item_cls(**d) for d in entry["items"]]
+        self.misses += 1
+        return key, None
+
+    def store(self, path: Path, key: str, items: list) -> None:
+        """Record freshly extracted items for a file."""
+        self._entries[str(path)] = {
+            "key": key,
+            "items": [asdict(item) for item in items],
+        }
+
+    def save(self) -> None:
+        """Write cache, dropping files not seen during this run."""
+        files = {p: e for p, e in self._entries.items() if p in self._seen}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps({"version": CACHE_VERSION, "files": files}, default=str))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write source cache {self.path}: {e}")
+            return
+        logger.info(f"Source cache {self.path.name}: {self.hits} hits, {self.misses} misses")
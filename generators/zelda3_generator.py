@@ -16,24 +16,20 @@ from typing import Any, Optional
 
 from agents.training.base import DataGenerator, SourceItem, TrainingSample
 from agents.training.json_utils import extract_json_from_response
+from hafs_scawful.generators.prefilter import asm_prefilter_reason
 from hafs_scawful.generators.prompt_templates import PromptTemplateRotator
+from hafs_scawful.generators.resource_index import load_resource_index
+from hafs_scawful.generators.source_cache import SourceItemCache
 from agents.training.resource_discovery import ZeldaResourceIndexer
 from config.prompts import get_prompt
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_TEACHER_PROMPT = """You are an expert SNES 65816 assembly programmer specializing in Zelda: A Link to the Past. {instruction_prefix}.
+# Static preamble shared by every zelda3 request. Kept separate from the
+# per-routine part and sent first so providers can reuse the cached prefix.
+DEFAULT_TEACHER_SYSTEM_PROMPT = """You are an expert SNES 65816 assembly programmer specializing in Zelda: A Link to the Past.
 
-This is from the zelda3 vanilla disassembly project - fully labeled, production-quality Nintendo code.
-
-ROUTINE: {label}
-CONTEXT:
-{context}
-
-CODE:
-```asm
-{code}
-```
+You will be given a routine from the zelda3 vanilla disassembly project - fully labeled, production-quality Nintendo code.
 
 Generate a JSON object with:
 
@@ -65,11 +61,23 @@ QUALITY REQUIREMENTS:
 - Maintain technical accuracy about SNES hardware
 
 JSON FORMAT:
-{{
+{
   "instruction": "...",
   "input": "...",
   "output": "..."
-}}
+}
+"""
+
+DEFAULT_TEACHER_PROMPT = """{instruction_prefix}.
+
+ROUTINE: {label}
+CONTEXT:
+{context}
+
+CODE:
+```asm
+{code}
+```
 """
 
 
@@ -108,12 +116,28 @@ class Zelda3DisasmGenerator(DataGenerator):
     # Regex to detect labels (start of routine)
     LABEL_PATTERN = re.compile(r"^(\w+):\s*(?:;.*)?$")
 
+    # Whole-file variant of LABEL_PATTERN: finds every label line in one pass
+    LABEL_LINE_PATTERN = re.compile(r"^[^\S\n]*(\w+):[^\S\n]*(?:;.*)?$", re.MULTILINE)
+
     # Regex to detect JSR/JSL calls
     CALL_PATTERN = re.compile(r"\b(?:JSR|JSL)\s+(\w+)")
 
     # Regex to extract addresses from comments
     ADDRESS_PATTERN = re.compile(r"\$([0-9A-Fa-f]{2}):([0-9A-Fa-f]{4})")
 
+    # Prompt code budget: oversized routines are sent as head + tail only
+    MAX_PROMPT_CODE_CHARS = 4000
+    PROMPT_HEAD_LINES = 40
+    PROMPT_TAIL_LINES = 20
+
+    # Teacher request budget: fail fast on wedged calls and retry with backoff,
+    # all within ITEM_DEADLINE (the old single-call bound) per item
+    REQUEST_TIMEOUT = 45.0
+    MAX_ATTEMPTS = 3
+    MAX_BACKOFF = 8.0
+    ITEM_DEADLINE = 120.0
+    RETRYABLE_ERRORS = (asyncio.TimeoutError, ConnectionError)
+
     def __init__(self, use_template_variation: bool = True, max_routine_lines: int = 100):
         """Initialize zelda3 disassembly generator.
 
@@ -139,14 +163,8 @@ class Zelda3DisasmGenerator(DataGenerator):
         """Initialize resources and index zelda3 files."""
         await super().setup()
 
-        # Initialize resource indexer
-        self._indexer = ZeldaResourceIndexer()
-
-        # Load or build index
-        index_result = self._indexer.load_index()
-        if not index_result:
-            logger.info("Building zelda3 resource index...")
-            index_result = await self._indexer.discover_and_index()
+        # Load or build the resource index (shared with other generators)
+        self._indexer, index_result = await load_resource_index()
 
         logger.info(f"Zelda3 index loaded: {index_result.total_files} files")
 
@@ -164,11 +182,16 @@ class Zelda3DisasmGenerator(DataGenerator):
 
         # Get ALL ASM files - vanilla disassembly is scattered across sources
         # Filter out ROM hacks (Oracle-of-Secrets) to focus on vanilla
+        # Resolve each distinct source dir once instead of once per file
         zelda3_root = self.ZELDA3_PATH.resolve()
+        resolved_sources = {
+            d: Path(d).resolve()
+            for d in {f.source_dir for f in self._indexer._files}
+        }
         asm_files = [
             f for f in self._indexer._files
             if f.file_type in ("asm", "asm_include")
-            and Path(f.source_dir).resolve() == zelda3_root
+            and resolved_sources[f.source_dir] == zelda3_root
             and "Oracle-of-Secrets" not in f.source_dir  # Exclude ROM hacks
             and "lib" not in f.relative_path  # Exclude library code
             and "imgui" not in f.relative_path  # Exclude imgui docs
@@ -176,13 +199,22 @@ class Zelda3DisasmGenerator(DataGenerator):
 
         logger.info(f"Found {len(asm_files)} vanilla ASM files to process")
 
+        # Skip re-parsing files unchanged since the last run
+        cache = SourceItemCache(f"zelda3_routines_{self.max_routine_lines}", Zelda3SourceItem)
+        cache.load()
+
         for resource_file in asm_files:
             try:
-                file_items = await self._extract_routines_from_file(resource_file.path)
+                key, file_items = cache.lookup(resource_file.path)
+                if file_items is None:
+                    file_items = await self._extract_routines_from_file(resource_file.path)
+                    cache.store(resource_file.path, key, file_items)
                 items.extend(file_items)
             except Exception as e:
                 logger.error(f"Error processing {resource_file.path}: {e}")
 
+        cache.save()
+
         logger.info(f"Extracted {len(items)} routines from zelda3 disassembly")
         return items
 
@@ -193,15 +225,14 @@ class Zelda3DisasmGenerator(DataGenerator):
         try:
             content = path.read_text(errors="replace")
             lines = content.split("\n")
+            labels = self._find_label_lines(content)
 
             current_routine: Optional[dict] = None
 
             for i, line in enumerate(lines):
-                stripped = line.strip()
-
                 # Check for label (start of new routine)
-                label_match = self.LABEL_PATTERN.match(stripped)
-                if label_match:
+                label = labels.get(i)
+                if label:
                     # Save previous routine if exists
                     if current_routine:
                         item = self._finalize_routine(current_routine, path)
@@ -209,7 +240,6 @@ class Zelda3DisasmGenerator(DataGenerator):
                             items.append(item)
 
                     # Start new routine
-                    label = label_match.group(1)
                     current_routine = {
                         "label": label,
                         "line_start": i,
@@ -224,11 +254,9 @@ class Zelda3DisasmGenerator(DataGenerator):
                     current_routine["code_lines"].append(line)
 
                     # Extract comments
-                    if ";" in line:
-                        comment_start = line.index(";")
-                        comment = line[comment_start + 1:].strip()
-                        if comment:
-                            current_routine["comments"].append(comment)
+                    _, sep, tail = line.partition(";")
+                    if sep and (comment := tail.strip()):
+                        current_routine["comments"].append(comment)
 
                     # Extract JSR/JSL calls
                     call_matches = self.CALL_PATTERN.findall(line)
@@ -241,8 +269,8 @@ class Zelda3DisasmGenerator(DataGenerator):
 
                     # Check for end of routine (empty line, new label, or max lines)
                     routine_length = len(current_routine["code_lines"])
-                    is_empty = not stripped
-                    is_next_label = i + 1 < len(lines) and self.LABEL_PATTERN.match(lines[i + 1].strip())
+                    is_empty = not line or line.isspace()
+                    is_next_label = (i + 1) in labels
 
                     if is_empty or is_next_label or routine_length >= self.max_routine_lines:
                         item = self._finalize_routine(current_routine, path)
@@ -261,6 +289,21 @@ class Zelda3DisasmGenerator(DataGenerator):
 
         return items
 
+    def _find_label_lines(self, content: str) -> dict[int, str]:
+        """Map line number -> label for every label line in the file.
+
+        Runs LABEL_LINE_PATTERN over the whole file so the regex engine does
+        the line iteration instead of a strip() + match() per line.
+        """
+        labels: dict[int, str] = {}
+        line_no = 0
+        pos = 0
+        for match in self.LABEL_LINE_PATTERN.finditer(content):
+            line_no += content.count("\n", pos, match.start())
+            pos = match.start()
+            labels[line_no] = match.group(1)
+        return labels
+
     def _finalize_routine(self, routine_data: dict, path: Path) -> Optional[Zelda3SourceItem]:
         """Convert routine data dict to Zelda3SourceItem."""
         # Filter out very short routines (< 5 lines)
@@ -305,6 +348,17 @@ class Zelda3DisasmGenerator(DataGenerator):
 
     def get_teacher_prompt(self, item: SourceItem) -> str:
         """Generate teacher prompt for zelda3 routine."""
+        system_text, user_text = self.get_teacher_prompt_parts(item)
+        return f"{system_text}\n\n{user_text}" if system_text else user_text
+
+    def get_teacher_prompt_parts(self, item: SourceItem) -> tuple[Optional[str], str]:
+        """Split the teacher prompt into (system message, per-routine text).
+
+        The system message is identical for every routine and is sent
+        separately, giving providers a cacheable prefix. A legacy single
+        ``prompt`` override (preamble included) is used as-is with no
+        system message, so its preamble is not sent twice.
+        """
         if not isinstance(item, Zelda3SourceItem):
             raise TypeError(f"Expected Zelda3SourceItem, got {type(item)}")
 
@@ -327,8 +381,8 @@ class Zelda3DisasmGenerator(DataGenerator):
             context_parts.append(f"ROM address: {item.address}")
 
         if item.comments:
-            # Use first few comments as description
-            desc = " ".join(item.comments[:3])
+            # Use first few comments as description (collapse whitespace runs)
+            desc = " ".join(" ".join(c.split()) for c in item.comments[:3])
             context_parts.append(f"Description: {desc}")
 
         if item.labels_called:
@@ -337,16 +391,73 @@ class Zelda3DisasmGenerator(DataGenerator):
 
         context = "\n".join(context_parts) if context_parts else "No additional context"
 
-        template = get_prompt(
+        fields = {
+            "instruction_prefix": instruction_prefix,
+            "label": item.label,
+            "context": context,
+            "code": self._truncate_code(item.code),
+        }
+
+        legacy_template = get_prompt(
             "agents.training.generators.zelda3_generator.prompt",
-            default=DEFAULT_TEACHER_PROMPT,
+            default="",
+        )
+        if legacy_template:
+            return None, legacy_template.format(**fields)
+
+        system_text = get_prompt(
+            "agents.training.generators.zelda3_generator.system_prompt",
+            default=DEFAULT_TEACHER_SYSTEM_PROMPT,
         )
-        return template.format(
-            instruction_prefix=instruction_prefix,
-            label=item.label,
-            context=context,
-            code=item.code,
+        template = get_prompt(
+            "agents.training.generators.zelda3_generator.user_prompt",
+            default=DEFAULT_TEACHER_PROMPT,
         )
+        return system_text.strip(), template.format(**fields)
+
+    def _truncate_code(self, code: str) -> str:
+        """Cap routine code embedded in the teacher prompt.
+
+        Routines over MAX_PROMPT_CODE_CHARS keep their first and last lines
+        with an omission marker in between, which is enough for the teacher
+        to see the entry point and the return path.
+        """
+        if len(code) <= self.MAX_PROMPT_CODE_CHARS:
+            return code
+
+        lines = code.split("\n")
+        keep = self.PROMPT_HEAD_LINES + self.PROMPT_TAIL_LINES
+        if len(lines) <= keep:
+            return code[: self.MAX_PROMPT_CODE_CHARS] + "\n... (truncated)"
+
+        omitted = len(lines) - keep
+        head = lines[: self.PROMPT_HEAD_LINES]
+        tail = lines[-self.PROMPT_TAIL_LINES:]
+        return "\n".join(head + [f"... <omitted {omitted} lines> ..."] + tail)
+
+    async def _generate_with_retry(self, prompt: str, **kwargs: Any):
+        """Call the orchestrator with a per-attempt timeout and backoff.
+
+        Timeouts and connection errors are retried up to MAX_ATTEMPTS with
+        exponential backoff (1s, 2s, ... capped at MAX_BACKOFF); anything
+        else propagates immediately. Attempts and backoff together never
+        exceed ITEM_DEADLINE (raises TimeoutError).
+        """
+        async with asyncio.timeout(self.ITEM_DEADLINE):
+            for attempt in range(self.MAX_ATTEMPTS):
+                try:
+                    return await asyncio.wait_for(
+                        self._orchestrator.generate(prompt=prompt, **kwargs),
+                        timeout=self.REQUEST_TIMEOUT,
+                    )
+                except self.RETRYABLE_ERRORS as e:
+                    if attempt == self.MAX_ATTEMPTS - 1:
+                        raise
+                    wait_time = min(2 ** attempt, self.MAX_BACKOFF)
+                    logger.debug(
+                        f"Teacher call failed (attempt {attempt + 1}): {e!r}, retrying in {wait_time}s"
+                    )
+                    await asyncio.sleep(wait_time)
 
     async def generate_sample(self, item: SourceItem) -> Optional[TrainingSample]:
         """Use teacher model to generate instruction from zelda3 routine."""
@@ -356,18 +467,15 @@ class Zelda3DisasmGenerator(DataGenerator):
         if not self._orchestrator:
             await self.setup()
 
-        prompt = self.get_teacher_prompt(item)
+        system_text, prompt = self.get_teacher_prompt_parts(item)
+        # Preamble goes as a real system message; legacy prompts have none
+        system_kwargs = {"system_prompt": system_text} if system_text else {}
 
         try:
             from core.orchestrator_v2 import Provider, TaskTier
 
-            response_obj = await asyncio.wait_for(
-                self._orchestrator.generate(
-                    prompt=prompt,
-                    tier=TaskTier.CODING,
-                    provider=Provider.GEMINI,
-                ),
-                timeout=120.0,
+            response_obj = await self._generate_with_retry(
+                prompt, tier=TaskTier.CODING, provider=Provider.GEMINI, **system_kwargs
             )
 
             response = response_obj.content
@@ -388,17 +496,25 @@ class Zelda3DisasmGenerator(DataGenerator):
             if item.address:
                 kg_entities.append(item.address)
 
-            return TrainingSample(
+            sample = TrainingSample(
                 instruction=instruction,
                 input=input_text,
                 output=output,
                 domain="asm",
                 source="zelda3_disasm",
                 teacher_model="gemini-3-flash-preview",
-                teacher_prompt=str(prompt),
+                teacher_prompt=f"{system_text}\n\n{prompt}" if system_text else prompt,
                 kg_entities=kg_entities,
             )
 
+            # Drop malformed responses before the quality pipeline scores them
+            reason = asm_prefilter_reason(sample)
+            if reason:
+                logger.debug(f"Prefilter dropped {item.label}: {reason}")
+                return None
+
+            return sample
+
         except asyncio.TimeoutError:
             logger.warning(f"Timeout generating for {item.label}")
             return None
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import logging
+import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
 
@@ -21,3 +24,40 @@ def ensure_hafs_on_path() -> None:
         if candidate.exists() and str(candidate) not in sys.path:
             sys.path.insert(0, str(candidate))
             return
+
+
+def install_uvloop() -> bool:
+    """Use uvloop's event loop policy when available (not on Windows).
+
+    Returns:
+        True if uvloop was installed, False if the default loop is kept.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
+def install_queue_logging() -> logging.handlers.QueueListener:
+    """Move the root logger's handlers behind a QueueHandler.
+
+    Records are formatted and written by a QueueListener thread, so log I/O
+    never blocks the event loop. Call after logging.basicConfig(); stop the
+    returned listener before exit to flush pending records.
+    """
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    return listener
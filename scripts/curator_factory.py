@@ -0,0 +1,121 @@
+"""Shared DataCurator factory for the dataset scripts.
+
+One DataCurator is built once per process and reused across profiles. A
+generator class that appears in several profiles (asm, oracle) is also set
+up once: its spec kwargs are prompt-mode flags, re-applied to the existing
+instance when another profile registers it. Running the improved and oracle
+profiles back-to-back (see generate_all_datasets.py) therefore pays for
+curator setup and the asm/oracle generator setup only once.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from hafs_scawful.scripts.generator_registry import GeneratorSpec, setup_generators
+
+IMPROVED_GENERATORS = [
+    GeneratorSpec(
+        "asm", "hafs_scawful.generators.asm_generator", "AsmDataGenerator",
+        {"use_template_variation": True, "use_enhanced_prompts": False},
+        label="ASM generator", detail="with prompt templates",
+    ),
+    GeneratorSpec(
+        "documentation", "hafs_scawful.generators.documentation_generator", "DocumentationGenerator",
+        label="Documentation generator", detail="ROM hacking guides",
+    ),
+    GeneratorSpec(
+        "oracle", "hafs_scawful.generators.oracle_generator", "OracleDataGenerator",
+        {"use_template_variation": True, "use_enhanced_prompts": False}, optional=True,
+        label="Oracle generator", detail="with prompt templates",
+    ),
+    GeneratorSpec(
+        "hack_curated", "hafs_scawful.generators.curated_hack_generator", "CuratedHackGenerator",
+        optional=True, ready_attr="has_hacks",
+        label="Curated hack generator", detail="allowlist",
+    ),
+    GeneratorSpec(
+        "cpp", "hafs_scawful.generators.cpp_generator", "CppDataGenerator",
+        {"use_template_variation": True}, optional=True, requires_path="yaze_path",
+        label="C++ generator", detail="with prompt templates",
+    ),
+]
+
+ORACLE_GENERATORS = [
+    # Primary
+    GeneratorSpec(
+        "oracle", "hafs_scawful.generators.oracle_generator", "OracleDataGenerator",
+        {"use_template_variation": True, "use_enhanced_prompts": True},
+        label="Oracle generator", detail="secrets system, ROM hack routines",
+    ),
+    # Secondary
+    GeneratorSpec(
+        "asm", "hafs_scawful.generators.asm_generator", "AsmDataGenerator",
+        {"use_template_variation": True, "use_enhanced_prompts": True},
+        label="ASM generator", detail="65816 with Oracle hooks",
+    ),
+    # Cross-domain comparison only
+    GeneratorSpec(
+        "gigaleak", "hafs_scawful.generators.gigaleak_generator", "GigaleakDataGenerator",
+        label="Gigaleak generator", detail="production commentary for pairing",
+    ),
+]
+
+PROFILES: dict[str, list[GeneratorSpec]] = {
+    "improved": IMPROVED_GENERATORS,
+    "oracle": ORACLE_GENERATORS,
+}
+
+_curator: Any = None
+# Spec kwargs only select prompt modes; list every flag explicitly so a
+# reused instance never keeps a mode from the previous profile
+_generators: dict[tuple, Any] = {}  # spec key -> set-up generator
+
+
+def _spec_key(spec: GeneratorSpec) -> tuple:
+    # Setup (KB loads, indexes) doesn't depend on the prompt-mode kwargs
+    return (spec.name, spec.module, spec.class_name)
+
+
+async def build_curator(
+    profile: str,
+    domains: Optional[set[str]] = None,
+    log: Callable[[str], None] = print,
+) -> tuple[Any, list[tuple[str, Any]]]:
+    """Return the shared curator with a profile's generators registered.
+
+    Generators of the same class already set up by an earlier profile are
+    switched to this profile's prompt modes and re-registered, not rebuilt.
+
+    Returns:
+        (curator, [(domain, generator), ...] registered for this profile)
+    """
+    global _curator
+    if _curator is None:
+        # Deferred so --help doesn't pay for the curator's transitive imports
+        from agents.training.curator import DataCurator
+
+        _curator = DataCurator()
+        await _curator.setup()
+
+    specs = [s for s in PROFILES[profile] if domains is None or s.name in domains]
+
+    registered: list[tuple[str, Any]] = []
+    fresh: list[GeneratorSpec] = []
+    for spec in specs:
+        gen = _generators.get(_spec_key(spec))
+        if gen is None:
+            fresh.append(spec)
+            continue
+        for attr, value in spec.kwargs.items():
+            setattr(gen, attr, value)
+        _curator.register_generator(spec.name, gen)
+        registered.append((spec.name, gen))
+        log(f"✓ {spec.label or spec.class_name} (reused)")
+
+    by_name = {spec.name: spec for spec in fresh}
+    for name, gen in await setup_generators(_curator, fresh, log=log):
+        _generators[_spec_key(by_name[name])] = gen
+        registered.append((name, gen))
+
+    return _curator, registered
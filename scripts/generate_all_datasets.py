@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Run the improved and oracle dataset profiles back-to-back in one process.
+
+Both profiles share one DataCurator via curator_factory, and the asm and
+oracle generators they have in common are set up once and switched to each
+profile's prompt modes. Profiles run sequentially: they share the curator's
+registry and those generator instances.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from hafs_scawful.scripts.bootstrap import (
+    ensure_hafs_on_path,
+    install_queue_logging,
+    install_uvloop,
+)
+
+ensure_hafs_on_path()
+
+from hafs_scawful.scripts import generate_improved_dataset, generate_oracle_dataset
+
+
+async def generate_all(concurrency: int) -> int:
+    await generate_improved_dataset.main(
+        generate_improved_dataset.parse_args(["--concurrency", str(concurrency)])
+    )
+    return await generate_oracle_dataset.main(
+        generate_oracle_dataset.parse_args(["--concurrency", str(concurrency)])
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate improved + oracle datasets")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Concurrent teacher requests per generator (default: 10)",
+    )
+    args = parser.parse_args()
+    install_uvloop()
+    listener = install_queue_logging()
+    try:
+        return asyncio.run(generate_all(args.concurrency))
+    finally:
+        listener.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,184 +12,191 @@ Applies all improvements:
 Target: 1000+ samples with <20% rejection rate
 """
 
+import argparse
 import asyncio
+import logging
+import time
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
+from hafs_scawful.scripts.bootstrap import (
+    ensure_hafs_on_path,
+    install_queue_logging,
+    install_uvloop,
+)
 
 ensure_hafs_on_path()
 
-from agents.training.curator import DataCurator
-
-
-async def main():
-    print("=" * 80)
-    print("IMPROVED DATASET GENERATION - Phase 1 + Phase 2 Diversity Features")
-    print("=" * 80)
-    print()
-
-    # Initialize curator
-    print("[1/5] Initializing DataCurator...")
-    curator = DataCurator()
-    await curator.setup()
-    print("✓ Curator initialized with augmentation and cross-domain support")
-    print()
-
-    # Register generators with diversity improvements
-    print("[2/5] Registering improved generators...")
-
-    # ASM generator with template variation
-    from hafs_scawful.generators.asm_generator import AsmDataGenerator
-    asm_gen = AsmDataGenerator(use_template_variation=True)
-    await asm_gen.setup()
-    curator.register_generator("asm", asm_gen)
-    print("✓ ASM generator (with prompt templates)")
+from hafs_scawful.scripts.curator_factory import IMPROVED_GENERATORS, build_curator
+from hafs_scawful.scripts.generator_registry import (
+    CallStats,
+    enable_call_timeouts,
+    enable_parallel_generation,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate improved training dataset")
+    parser.add_argument(
+        "--domains",
+        type=str,
+        default=",".join(spec.name for spec in IMPROVED_GENERATORS),
+        help="Comma-separated generator domains to load (default: all)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Concurrent teacher requests per generator (default: 10, 1 = sequential)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=180.0,
+        help="Per-sample generation timeout in seconds (default: 180, 0 = none)",
+    )
+    parser.add_argument(
+        "--output-name",
+        type=str,
+        default=None,
+        help="Dataset output name; reuse it to resume (default: timestamped)",
+    )
+    parser.add_argument(
+        "--resume",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Resume from generator checkpoints of a previous run "
+            "(default: on with --output-name, off otherwise)"
+        ),
+    )
+    return parser.parse_args(argv)
 
-    # Documentation generator (NEW - Phase 1.2)
-    from hafs_scawful.generators.documentation_generator import DocumentationGenerator
-    doc_gen = DocumentationGenerator()
-    await doc_gen.setup()
-    curator.register_generator("documentation", doc_gen)
-    print(f"✓ Documentation generator (ROM hacking guides)")
 
-    # Oracle generator with template variation (if available)
-    try:
-        from hafs_scawful.generators.oracle_generator import OracleDataGenerator
-        oracle_gen = OracleDataGenerator(use_template_variation=True)
-        await oracle_gen.setup()
-        curator.register_generator("oracle", oracle_gen)
-        print("✓ Oracle generator (with prompt templates)")
-    except Exception as e:
-        print(f"⚠ Oracle generator not available: {e}")
-
-    # Curated hack generator (allowlist)
-    try:
-        from hafs_scawful.generators.curated_hack_generator import CuratedHackGenerator
-        curated_gen = CuratedHackGenerator()
-        await curated_gen.setup()
-        if curated_gen.has_hacks:
-            curator.register_generator("hack_curated", curated_gen)
-            print("✓ Curated hack generator (allowlist)")
-        else:
-            print("⚠ Curated hack generator: allowlist empty")
-    except Exception as e:
-        print(f"⚠ Curated hack generator not available: {e}")
+async def main(args: argparse.Namespace):
+    requested = {d.strip() for d in args.domains.split(",") if d.strip()}
 
-    # C++ generator with template variation
-    try:
-        from hafs_scawful.generators.cpp_generator import CppDataGenerator
-        cpp_gen = CppDataGenerator(use_template_variation=True)
-        if cpp_gen.yaze_path.exists():
-            await cpp_gen.setup()
-            curator.register_generator("cpp", cpp_gen)
-            print("✓ C++ generator (with prompt templates)")
-        else:
-            print("⚠ C++ generator: YAZE path not found")
-    except Exception as e:
-        print(f"⚠ C++ generator not available: {e}")
+    logger.info("=" * 80)
+    logger.info("IMPROVED DATASET GENERATION - Phase 1 + Phase 2 Diversity Features")
+    logger.info("=" * 80)
 
-    print()
+    # Initialize curator and register generators with diversity improvements
+    logger.info("[1/5] Initializing DataCurator...")
+    logger.info("[2/5] Registering improved generators...")
+    curator, registered = await build_curator("improved", requested, log=logger.info)
+    if args.concurrency > 1:
+        enable_parallel_generation(registered, args.concurrency)
+    call_stats = CallStats()
+    if args.timeout > 0:
+        enable_call_timeouts(registered, args.timeout, call_stats)
 
     # Curate dataset with all improvements
-    print("[3/5] Curating dataset with diversity improvements...")
-    print("Features enabled:")
-    print("  - Prompt variation templates (15-20 per domain)")
-    print("  - Resource discovery (1,818 source files)")
-    print("  - Synthetic augmentation (3x high-quality samples)")
-    print("  - Cross-domain combinations (ASM+Oracle, YAZE+narrative)")
-    print()
-
-    domains = curator.list_domains()
-    print(f"Registered domains: {', '.join(domains)}")
-    print()
+    logger.info("\n[3/5] Curating dataset with diversity improvements...")
+    logger.info("Features enabled:")
+    logger.info("  - Prompt variation templates (15-20 per domain)")
+    logger.info("  - Resource discovery (1,818 source files)")
+    logger.info("  - Synthetic augmentation (3x high-quality samples)")
+    logger.info("  - Cross-domain combinations (ASM+Oracle, YAZE+narrative)")
+
+    # Registered names, not curator.list_domains(): the shared curator may
+    # also hold generators from another profile
+    domains = [name for name, _ in registered]
+    logger.info(f"Registered domains: {', '.join(domains)}")
+
+    # A fixed --output-name lets a rerun resume; otherwise start fresh.
+    # ns suffix: unique even for scripted reruns within the same second
+    output_name = args.output_name
+    if not output_name:
+        output_name = f"oracle_farore_improved_{time.time_ns():x}"
+    resume = args.resume if args.resume is not None else args.output_name is not None
+    logger.info(f"Output: {output_name} (resume: {'on' if resume else 'off'})")
 
     result = await curator.curate_dataset(
         domains=domains,
         target_count=1000,  # Target 1000 samples
         quality_threshold=None,  # Use domain-specific thresholds
         balance_domains=True,
-        output_name="oracle_farore_improved",
-        resume=False,
+        output_name=output_name,
+        resume=resume,
         cross_domain_samples=0,  # Cross-domain infrastructure ready but pairing logic TBD
     )
 
-    print()
-    print("=" * 80)
-    print("[4/5] CURATION RESULTS")
-    print("=" * 80)
+    logger.info("\n" + "=" * 80)
+    logger.info("[4/5] CURATION RESULTS")
+    logger.info("=" * 80)
 
     stats = result.stats
-    print(f"Total Generated:     {stats.total_generated}")
-    print(f"Passed Quality:      {stats.passed_quality}")
-    print(f"Deduplicated:        {stats.deduplicated}")
-    print(f"Augmented (NEW):     {stats.augmented}")
-    print(f"Final Count:         {stats.final_count}")
-    print()
-
-    print("Split Distribution:")
-    print(f"  Train:  {len(result.splits.train)} samples")
-    print(f"  Val:    {len(result.splits.val)} samples")
-    print(f"  Test:   {len(result.splits.test)} samples")
-    print()
-
-    print("Domain Distribution:")
+    logger.info(f"Total Generated:     {stats.total_generated}")
+    logger.info(f"Passed Quality:      {stats.passed_quality}")
+    logger.info(f"Deduplicated:        {stats.deduplicated}")
+    logger.info(f"Augmented (NEW):     {stats.augmented}")
+    logger.info(f"Final Count:         {stats.final_count}")
+
+    logger.info("\nSplit Distribution:")
+    logger.info(f"  Train:  {len(result.splits.train)} samples")
+    logger.info(f"  Val:    {len(result.splits.val)} samples")
+    logger.info(f"  Test:   {len(result.splits.test)} samples")
+
+    logger.info("\nDomain Distribution:")
     for domain, count in stats.domain_counts.items():
         percentage = (count / stats.total_generated * 100) if stats.total_generated > 0 else 0
-        print(f"  {domain:20s} {count:4d} ({percentage:.1f}%)")
-    print()
+        logger.info(f"  {domain:20s} {count:4d} ({percentage:.1f}%)")
 
-    print(f"Average Quality:     {stats.quality_scores.get('average', 0.0):.3f}")
-    print(f"Duration:            {stats.duration_seconds:.1f}s")
-    print()
+    logger.info(f"\nAverage Quality:     {stats.quality_scores.get('average', 0.0):.3f}")
+    logger.info(f"Duration:            {stats.duration_seconds:.1f}s")
+    logger.info(f"Timeouts:            {call_stats.timeouts}")
 
     if result.output_dir:
-        print(f"Output Directory:    {result.output_dir}")
-        print()
+        logger.info(f"\nOutput Directory:    {result.output_dir}")
 
     # Calculate metrics
     if stats.total_generated > 0:
         acceptance_rate = (stats.passed_quality / stats.total_generated) * 100
         rejection_rate = 100 - acceptance_rate
 
-        print("=" * 80)
-        print("[5/5] DIVERSITY IMPROVEMENT METRICS")
-        print("=" * 80)
-        print()
-        print(f"Acceptance Rate:     {acceptance_rate:.1f}% (target: >70%)")
-        print(f"Rejection Rate:      {rejection_rate:.1f}% (baseline: 85%, target: <20%)")
-        print()
+        logger.info("\n" + "=" * 80)
+        logger.info("[5/5] DIVERSITY IMPROVEMENT METRICS")
+        logger.info("=" * 80)
+        logger.info(f"Acceptance Rate:     {acceptance_rate:.1f}% (target: >70%)")
+        logger.info(f"Rejection Rate:      {rejection_rate:.1f}% (baseline: 85%, target: <20%)")
 
         if rejection_rate < 20:
-            print("✓ EXCELLENT - Target achieved!")
+            logger.info("✓ EXCELLENT - Target achieved!")
         elif rejection_rate < 35:
-            print("✓ GOOD - Significant improvement over baseline")
+            logger.info("✓ GOOD - Significant improvement over baseline")
         else:
-            print("⚠ NEEDS IMPROVEMENT - Still above target")
+            logger.warning("⚠ NEEDS IMPROVEMENT - Still above target")
 
-        print()
-        print("Diversity Features Applied:")
-        print(f"  ✓ Prompt templates (15-20 per domain)")
-        print(f"  ✓ Resource discovery ({stats.total_generated} samples from 1,818 files)")
-        print(f"  ✓ Synthetic augmentation ({stats.augmented} augmented samples)")
+        logger.info("\nDiversity Features Applied:")
+        logger.info("  ✓ Prompt templates (15-20 per domain)")
+        logger.info(f"  ✓ Resource discovery ({stats.total_generated} samples from 1,818 files)")
+        logger.info(f"  ✓ Synthetic augmentation ({stats.augmented} augmented samples)")
         if stats.augmented > 0:
             multiplier = stats.final_count / (stats.passed_quality - stats.augmented + 1)
-            print(f"    Effective multiplier: {multiplier:.1f}x")
-        print(f"  ✓ Cross-domain infrastructure ready")
+            logger.info(f"    Effective multiplier: {multiplier:.1f}x")
+        logger.info("  ✓ Cross-domain infrastructure ready")
 
-        print()
-
-    print("=" * 80)
-    print("DATASET GENERATION COMPLETE")
-    print("=" * 80)
-    print()
+    logger.info("\n" + "=" * 80)
+    logger.info("DATASET GENERATION COMPLETE")
+    logger.info("=" * 80)
 
     if result.output_dir:
-        print(f"Dataset ready at: {result.output_dir}")
-        print()
-        print("Next steps:")
-        print("  1. Review quality metrics")
-        print("  2. Deploy to Windows for training")
-        print("  3. Launch oracle-farore-secrets model")
+        logger.info(f"Dataset ready at: {result.output_dir}")
+        logger.info("\nNext steps:")
+        logger.info("  1. Review quality metrics")
+        logger.info("  2. Deploy to Windows for training")
+        logger.info("  3. Launch oracle-farore-secrets model")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    install_uvloop()
+    listener = install_queue_logging()
+    try:
+        asyncio.run(main(args))
+    finally:
+        listener.stop()
@@ -9,19 +9,26 @@ Uses:
 Target: 1000+ high-quality samples focused on Oracle ROM hacking.
 """
 
+import argparse
 import asyncio
 import logging
 import sys
-from datetime import datetime
+import time
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
+from hafs_scawful.scripts.bootstrap import (
+    ensure_hafs_on_path,
+    install_queue_logging,
+    install_uvloop,
+)
 
 ensure_hafs_on_path()
 
-from agents.training.curator import DataCurator
-from hafs_scawful.generators.oracle_generator import OracleDataGenerator
-from hafs_scawful.generators.asm_generator import AsmDataGenerator
-from hafs_scawful.generators.gigaleak_generator import GigaleakDataGenerator
+from hafs_scawful.scripts.curator_factory import ORACLE_GENERATORS, build_curator
+from hafs_scawful.scripts.generator_registry import (
+    CallStats,
+    enable_call_timeouts,
+    enable_parallel_generation,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,8 +37,48 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def main():
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate Oracle-Farore training dataset")
+    parser.add_argument(
+        "--domains",
+        type=str,
+        default=",".join(spec.name for spec in ORACLE_GENERATORS),
+        help="Comma-separated generator domains to load (default: all)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Concurrent teacher requests per generator (default: 10, 1 = sequential)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=180.0,
+        help="Per-sample generation timeout in seconds (default: 180, 0 = none)",
+    )
+    parser.add_argument(
+        "--output-name",
+        type=str,
+        default=None,
+        help="Dataset output name; reuse it to resume (default: timestamped)",
+    )
+    parser.add_argument(
+        "--resume",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Resume from generator checkpoints of a previous run "
+            "(default: on with --output-name, off otherwise)"
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace):
     """Generate Oracle-focused dataset."""
+    requested = {d.strip() for d in args.domains.split(",") if d.strip()}
+
     logger.info("=" * 80)
     logger.info("ORACLE-FARORE DATASET GENERATION")
     logger.info("=" * 80)
@@ -40,34 +87,21 @@ async def main():
     logger.info("Quality threshold: per-domain defaults")
     logger.info("=" * 80)
 
-    # Initialize curator
-    curator = DataCurator()
-    await curator.setup()
-
-    # Register Oracle generator (primary)
-    logger.info("\nRegistering OracleDataGenerator...")
-    oracle_gen = OracleDataGenerator(use_enhanced_prompts=True)
-    await oracle_gen.setup()
-    curator.register_generator("oracle", oracle_gen)
-    logger.info("✓ Oracle generator (secrets system, ROM hack routines)")
-
-    # Register ASM generator (secondary)
-    logger.info("Registering AsmDataGenerator...")
-    asm_gen = AsmDataGenerator(use_enhanced_prompts=True)
-    await asm_gen.setup()
-    curator.register_generator("asm", asm_gen)
-    logger.info("✓ ASM generator (65816 with Oracle hooks)")
-
-    # Register Gigaleak generator (cross-domain comparison only)
-    logger.info("Registering GigaleakDataGenerator (cross-domain only)...")
-    gigaleak_gen = GigaleakDataGenerator()
-    await gigaleak_gen.setup()
-    curator.register_generator("gigaleak", gigaleak_gen)
-    logger.info("✓ Gigaleak generator (production commentary for pairing)")
-
-    # Generate timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_name = f"oracle_farore_fixed_{timestamp}"
+    # Initialize curator and register generators
+    logger.info("\nRegistering generators...")
+    curator, registered = await build_curator("oracle", requested, log=logger.info)
+    if args.concurrency > 1:
+        enable_parallel_generation(registered, args.concurrency)
+    call_stats = CallStats()
+    if args.timeout > 0:
+        enable_call_timeouts(registered, args.timeout, call_stats)
+
+    # A fixed --output-name lets a rerun resume; otherwise start fresh.
+    # ns suffix: unique even for scripted reruns within the same second
+    output_name = args.output_name
+    if not output_name:
+        output_name = f"oracle_farore_fixed_{time.time_ns():x}"
+    resume = args.resume if args.resume is not None else args.output_name is not None
 
     logger.info(f"\nOutput: {output_name}")
     logger.info("Starting generation...\n")
@@ -75,12 +109,12 @@ async def main():
     # Run curation with domain targets
     # Oracle: 500, ASM: 500, Cross-domain: 150
     result = await curator.curate_dataset(
-        domains=["oracle", "asm"],
+        domains=[d for d in ("oracle", "asm") if d in requested],
         target_count=1000,
         quality_threshold=None,
         balance_domains=True,
         output_name=output_name,
-        resume=False,
+        resume=resume,
         cross_domain_samples=150,
     )
 
@@ -91,6 +125,7 @@ async def main():
     logger.info(f"Passed quality: {result.stats.passed_quality}")
     logger.info(f"Final count: {result.stats.final_count}")
     logger.info(f"Acceptance rate: {result.stats.passed_quality / max(result.stats.total_generated, 1) * 100:.1f}%")
+    logger.info(f"Timeouts: {call_stats.timeouts}")
     logger.info("\nDomain breakdown:")
     for domain, count in result.stats.domain_counts.items():
         logger.info(f"  {domain}: {count}")
@@ -106,4 +141,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    args = parse_args()
+    install_uvloop()
+    listener = install_queue_logging()
+    try:
+        exit_code = asyncio.run(main(args))
+    finally:
+        listener.stop()
+    sys.exit(exit_code)
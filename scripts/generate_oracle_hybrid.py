@@ -26,17 +26,33 @@ Features:
 Target: 1000+ samples, <$2 API cost
 """
 
+import argparse
 import asyncio
+import itertools
 import json
 import logging
+import os
+import random
+import shutil
+import subprocess
 import sys
 import time
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, AsyncIterator, Callable, Iterable, Optional
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
+try:
+    import fcntl  # POSIX only; checkpoint locking is skipped elsewhere
+except ImportError:
+    fcntl = None
+
+try:
+    import orjson  # Optional: faster CLI response parsing and checkpoint I/O
+except ImportError:
+    orjson = None
+
+from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path, install_queue_logging
 
 ensure_hafs_on_path()
 
@@ -54,9 +70,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _json_loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# API keys read once at import
+_ENV = {k: os.environ.get(k) for k in ("GEMINI_API_KEY", "ANTHROPIC_API_KEY", "OPENAI_API_KEY")}
+
 # Checkpoint directory
 CHECKPOINT_DIR = Path.home() / ".context" / "training" / "checkpoints"
 
+CHECKPOINT_SCHEMA_VERSION = 2
+
+
+def _migrate_v1_to_v2(data: dict) -> None:
+    """v1 checkpoints predate schema_version; fields are otherwise unchanged."""
+    data["schema_version"] = 2
+
+
+# from_version -> migration mutating the loaded dict to from_version + 1
+_MIGRATIONS = {
+    1: _migrate_v1_to_v2,
+}
+
 
 @dataclass
 class GenerationCheckpoint:
@@ -70,16 +113,82 @@ class GenerationCheckpoint:
     provider_usage: dict = field(default_factory=dict)
     estimated_cost_usd: float = 0.0
     failed_items: list = field(default_factory=list)
+    schema_version: int = CHECKPOINT_SCHEMA_VERSION
 
-    def save(self):
-        """Save checkpoint to disk."""
-        CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
-        checkpoint_path = CHECKPOINT_DIR / f"{self.output_name}.json"
+    # Minimum seconds between non-forced saves
+    SAVE_INTERVAL = 5.0
+
+    def save(self, force: bool = False) -> bool:
+        """Save checkpoint to disk atomically.
+
+        Writes a temp file, fsyncs it and renames it over the checkpoint, so
+        a crash mid-write never leaves a truncated file. Non-forced saves
+        within SAVE_INTERVAL of the previous one are skipped.
+
+        Returns:
+            True if the checkpoint was written
+        """
+        now = time.monotonic()
+        if not force and now - getattr(self, "_last_save", float("-inf")) < self.SAVE_INTERVAL:
+            return False
+
+        self.write_snapshot(self.snapshot())
+        self._last_save = now
+        return True
+
+    def snapshot(self) -> bytes:
+        """Serialize the checkpoint as it is now.
+
+        Call on the thread that mutates the checkpoint (the event loop), so
+        no list or dict changes size while it is being walked.
+        """
         self.last_updated = datetime.now().isoformat()
-        with open(checkpoint_path, "w") as f:
-            json.dump(asdict(self), f, indent=2)
+        # Compact: rewritten on every save and rarely read by humans
+        # (use --dump-checkpoint to pretty-print)
+        return _json_dumps(asdict(self))
+
+    def write_snapshot(self, data: bytes) -> None:
+        """Atomically write serialized checkpoint bytes; safe in a worker thread."""
+        self.acquire_lock()
+        checkpoint_path = CHECKPOINT_DIR / f"{self.output_name}.json"
+        tmp_path = checkpoint_path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, checkpoint_path)
         logger.debug(f"Checkpoint saved: {checkpoint_path}")
 
+    def acquire_lock(self) -> None:
+        """Take an exclusive lock on this checkpoint for the process lifetime.
+
+        Prevents two runs from resuming (and clobbering) the same checkpoint.
+
+        Raises:
+            RuntimeError: If another process holds the lock
+        """
+        if fcntl is None or getattr(self, "_lock_file", None) is not None:
+            return
+
+        CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+        lock_path = CHECKPOINT_DIR / f"{self.output_name}.lock"
+        lock_file = open(lock_path, "a+")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.seek(0)
+            holder = lock_file.read().strip() or "unknown"
+            lock_file.close()
+            raise RuntimeError(
+                f"Checkpoint {self.output_name} already in use by PID {holder}"
+            )
+
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._lock_file = lock_file  # Held (and locked) until the process exits
+
     @classmethod
     def load(cls, output_name: str) -> Optional["GenerationCheckpoint"]:
         """Load checkpoint from disk."""
@@ -87,9 +196,17 @@ class GenerationCheckpoint:
         if not checkpoint_path.exists():
             return None
         try:
-            with open(checkpoint_path) as f:
-                data = json.load(f)
-            return cls(**data)
+            data = _json_loads(checkpoint_path.read_bytes())
+
+            version = data.get("schema_version", 1)
+            while version < CHECKPOINT_SCHEMA_VERSION:
+                _MIGRATIONS[version](data)
+                logger.info(f"Migrated checkpoint {output_name}: v{version} → v{version + 1}")
+                version += 1
+
+            # Drop keys this version doesn't know (e.g. written by a newer script)
+            known = {f.name for f in fields(cls)}
+            return cls(**{k: v for k, v in data.items() if k in known})
         except Exception as e:
             logger.warning(f"Failed to load checkpoint: {e}")
             return None
@@ -106,14 +223,54 @@ class GenerationCheckpoint:
         )
 
 
+class RateLimiter:
+    """Async token bucket: at most `rate` acquisitions per `period` seconds.
+
+    Used as `async with limiter:` around each provider request so concurrent
+    batches stay under provider rate limits instead of tripping 429s.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate, self._tokens + (now - self._updated) * self.rate / self.period
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def backoff_delay(attempt: int, base: float = 1.0) -> float:
+    """Exponential backoff with jitter so concurrent retries don't synchronize."""
+    return base * 2 ** attempt + random.uniform(0, base * 0.1)
+
+
 @dataclass
 class ProviderHealth:
     """Track provider health for intelligent routing."""
     consecutive_failures: int = 0
-    last_failure_time: float = 0.0
+    last_failure_time: float = 0.0  # time.monotonic()
     total_requests: int = 0
     total_failures: int = 0
 
+    # Cooldown seconds indexed by consecutive failures: none below 3, then
+    # exponential backoff 30s, 60s, 120s, ... capped at 300s
+    _COOLDOWNS = (0, 0, 0, 30, 60, 120, 240, 300)
+
     def record_success(self):
         self.consecutive_failures = 0
         self.total_requests += 1
@@ -122,16 +279,12 @@ class ProviderHealth:
         self.consecutive_failures += 1
         self.total_failures += 1
         self.total_requests += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
 
     def is_healthy(self) -> bool:
         """Check if provider is healthy (not in cooldown)."""
-        if self.consecutive_failures >= 3:
-            # Exponential backoff: 30s, 60s, 120s, etc.
-            cooldown = min(30 * (2 ** (self.consecutive_failures - 3)), 300)
-            if time.time() - self.last_failure_time < cooldown:
-                return False
-        return True
+        cooldown = self._COOLDOWNS[min(self.consecutive_failures, len(self._COOLDOWNS) - 1)]
+        return time.monotonic() - self.last_failure_time >= cooldown
 
     def success_rate(self) -> float:
         if self.total_requests == 0:
@@ -152,15 +305,28 @@ class MultiProviderOrchestrator:
     OPUS_MODEL = "claude-opus-4.5"
     GPT_MODEL = "gpt-5.2"
 
+    # Per-domain provider schedule (weights); consecutive runs of one provider
+    # keep requests grouped. Unavailable providers are dropped after setup.
+    ROUTING_WEIGHTS = {
+        "oracle": [("gemini", 6), ("gpt", 4), ("opus", 3)],
+        "asm": [("gemini", 6), ("gpt", 4)],
+        "gigaleak": [("gpt", 1)],
+    }
+
+    # Requests per minute per API provider
+    RATE_LIMITS = {"gemini": 60, "gpt": 500, "opus": 50}
+
     def __init__(
         self,
         gpu_monitor: GPUMonitor,
         load_balancer: HybridLoadBalancer,
         max_retries: int = 3,
+        max_concurrency: int = 10,
     ):
         self.gpu_monitor = gpu_monitor
         self.load_balancer = load_balancer
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
         self._gpu_backend = None
         self._providers = {}
         self._request_count = {"gpu": 0, "gemini": 0, "opus": 0, "gpt": 0}
@@ -170,15 +336,36 @@ class MultiProviderOrchestrator:
             "opus": ProviderHealth(),
             "gpt": ProviderHealth(),
         }
+        # Bound in-flight API requests per provider for concurrent callers
+        self._semaphores = {
+            name: asyncio.Semaphore(max_concurrency) for name in self._provider_health
+        }
         self._estimated_cost = 0.0
+        self._routing_iters: dict[str, Any] = {}
+        # Providers with >= 3 consecutive failures; only these need is_healthy()
+        self._cooling: set[str] = set()
+        # Called after each successful request (e.g. to schedule a checkpoint save)
+        self.on_request: Optional[Callable[[], None]] = None
+        self._http = None  # Shared httpx.AsyncClient for the Anthropic/OpenAI SDKs
+        self._limits = {name: RateLimiter(rpm) for name, rpm in self.RATE_LIMITS.items()}
+
+        # Registry configs are immutable; resolve once instead of per request
+        self._model_configs = {
+            "gpu": get_model(self.GPU_MODEL),
+            "gemini": get_model(self.GEMINI_MODEL),
+            "opus": get_model(self.OPUS_MODEL),
+            "gpt": get_model(self.GPT_MODEL),
+        }
+        # provider -> (cost per input token, cost per output token)
+        self._token_costs = {
+            name: (config.cost_per_1m_input / 1_000_000, config.cost_per_1m_output / 1_000_000)
+            for name, config in self._model_configs.items()
+        }
 
     async def setup(self):
         """Initialize GPU backend and all API providers."""
-        import os
-        import subprocess
-
         # GPU backend (Ollama on medical-mechanica)
-        gpu_config = get_model(self.GPU_MODEL)
+        gpu_config = self._model_configs["gpu"]
         try:
             from backends.api.ollama import OllamaBackend
             self._gpu_backend = OllamaBackend(
@@ -193,8 +380,8 @@ class MultiProviderOrchestrator:
             self._gpu_backend = None
 
         # Gemini - only if API key configured
-        gemini_config = get_model(self.GEMINI_MODEL)
-        gemini_key = os.getenv("GEMINI_API_KEY")
+        gemini_config = self._model_configs["gemini"]
+        gemini_key = _ENV["GEMINI_API_KEY"]
         if gemini_key:
             try:
                 import google.generativeai as genai
@@ -207,16 +394,20 @@ class MultiProviderOrchestrator:
             logger.info("⊘ Gemini: GEMINI_API_KEY not set")
 
         # Claude Opus - API key first, then CLI fallback
-        opus_config = get_model(self.OPUS_MODEL)
-        anthropic_key = os.getenv("ANTHROPIC_API_KEY")
+        opus_config = self._model_configs["opus"]
+        anthropic_key = _ENV["ANTHROPIC_API_KEY"]
         if anthropic_key and anthropic_key.startswith("sk-ant-api"):
             try:
-                from anthropic import Anthropic
-                self._providers["opus"] = Anthropic(api_key=anthropic_key)
+                from anthropic import AsyncAnthropic
+                self._providers["opus"] = AsyncAnthropic(
+                    api_key=anthropic_key, http_client=self._shared_http_client()
+                )
                 self._opus_mode = "api"
                 logger.info(f"✓ {opus_config.display_name} (Console API)")
             except Exception as e:
                 logger.warning(f"Anthropic SDK init failed: {e}")
+        elif shutil.which("claude") is None:
+            logger.info("⊘ Opus: No API key and CLI not found")
         else:
             # Try Claude Code CLI as fallback
             try:
@@ -236,18 +427,59 @@ class MultiProviderOrchestrator:
                 logger.info(f"⊘ Opus: {e}")
 
         # GPT - only if API key configured
-        gpt_config = get_model(self.GPT_MODEL)
-        openai_key = os.getenv("OPENAI_API_KEY")
+        gpt_config = self._model_configs["gpt"]
+        openai_key = _ENV["OPENAI_API_KEY"]
         if openai_key:
             try:
-                from openai import OpenAI
-                self._providers["gpt"] = OpenAI(api_key=openai_key)
+                from openai import AsyncOpenAI
+                self._providers["gpt"] = AsyncOpenAI(
+                    api_key=openai_key, http_client=self._shared_http_client()
+                )
                 logger.info(f"✓ {gpt_config.display_name}")
             except Exception as e:
                 logger.warning(f"OpenAI init failed: {e}")
         else:
             logger.info(f"⊘ {gpt_config.display_name}: OPENAI_API_KEY not set")
 
+        self._build_routing_plans()
+
+    def _shared_http_client(self):
+        """One pooled httpx.AsyncClient shared by the API SDKs (HTTP/2 if h2 is installed)."""
+        if self._http is None:
+            import httpx
+
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+
+            self._http = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+                timeout=httpx.Timeout(120.0, connect=10.0),
+            )
+        return self._http
+
+    async def close(self):
+        """Close the shared HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _build_routing_plans(self) -> None:
+        """Expand ROUTING_WEIGHTS into cyclic schedules over available providers."""
+        self._routing_iters = {}
+        for domain, weights in self.ROUTING_WEIGHTS.items():
+            plan = [
+                name
+                for name, weight in weights
+                if name in self._providers
+                for _ in range(weight)
+            ]
+            if plan:
+                self._routing_iters[domain] = itertools.cycle(plan)
+
     def _select_provider(self, domain: str, complexity: str = "medium") -> str:
         """Select best provider based on domain and complexity."""
         # Complex Oracle samples → Best flagship (Opus if available, else GPT-5.2)
@@ -257,47 +489,42 @@ class MultiProviderOrchestrator:
             if "gpt" in self._providers:
                 return "gpt"  # GPT-5.2 as flagship fallback
 
-        # Oracle medium complexity → Mix Gemini + GPT-5.2 (or Opus if available)
-        if domain == "oracle":
-            # 60% Gemini (cheap), 40% GPT-5.2 (quality)
-            if "gpt" in self._providers and self._request_count["gemini"] > self._request_count["gpt"] * 1.5:
-                return "gpt"
-            if "opus" in self._providers and self._request_count["gemini"] > self._request_count["opus"] * 2.3:
-                return "opus"
-            if "gemini" in self._providers:
-                return "gemini"
-
-        # ASM samples → Mix Gemini + GPT
-        if domain == "asm":
-            # 60% Gemini, 40% GPT
-            if "gpt" in self._providers and self._request_count["gemini"] > self._request_count["gpt"] * 1.5:
-                return "gpt"
-            if "gemini" in self._providers:
-                return "gemini"
-
-        # Gigaleak → Prefer GPT-5.2 (good at code comparison)
-        if domain == "gigaleak":
-            if "gpt" in self._providers:
-                return "gpt"
+        # Oracle → Gemini/GPT-5.2/Opus mix, ASM → 60% Gemini, 40% GPT,
+        # Gigaleak → GPT-5.2 (good at code comparison)
+        plan = self._routing_iters.get(domain)
+        if plan is not None:
+            return next(plan)
 
         # Default: Gemini (fast/cheap)
         return "gemini"
 
     def _estimate_cost(self, provider_name: str, input_tokens: int = 1000, output_tokens: int = 500):
         """Estimate cost for a request."""
-        model_map = {
-            "gpu": self.GPU_MODEL,
-            "gemini": self.GEMINI_MODEL,
-            "opus": self.OPUS_MODEL,
-            "gpt": self.GPT_MODEL,
-        }
-        model_name = model_map.get(provider_name)
-        if not model_name:
+        costs = self._token_costs.get(provider_name)
+        if not costs:
             return 0.0
-        config = get_model(model_name)
-        input_cost = (input_tokens / 1_000_000) * config.cost_per_1m_input
-        output_cost = (output_tokens / 1_000_000) * config.cost_per_1m_output
-        return input_cost + output_cost
+        return input_tokens * costs[0] + output_tokens * costs[1]
+
+    def _is_available(self, name: str) -> bool:
+        """O(1) unless the provider is cooling down; then check whether it recovered."""
+        if name not in self._cooling:
+            return True
+        if self._provider_health[name].is_healthy():
+            self._cooling.discard(name)
+            return True
+        return False
+
+    def _record_success(self, name: str) -> None:
+        self._provider_health[name].record_success()
+        self._cooling.discard(name)
+        if self.on_request is not None:
+            self.on_request()
+
+    def _record_failure(self, name: str) -> None:
+        health = self._provider_health[name]
+        health.record_failure()
+        if health.consecutive_failures >= 3:
+            self._cooling.add(name)
 
     async def generate(self, prompt: str, domain: str = "unknown", **kwargs) -> "Response":
         """Generate with intelligent routing and retry logic."""
@@ -307,53 +534,42 @@ class MultiProviderOrchestrator:
             # Try GPU first if available and healthy
             use_gpu, reason = await self.load_balancer.should_use_gpu()
 
-            if use_gpu and self._gpu_backend and self._provider_health["gpu"].is_healthy():
+            if use_gpu and self._gpu_backend and self._is_available("gpu"):
                 try:
                     response = await self._gpu_backend.generate_one_shot(prompt)
                     self.load_balancer.record_request(used_gpu=True, success=True)
-                    self._provider_health["gpu"].record_success()
+                    self._record_success("gpu")
                     self._request_count["gpu"] += 1
                     return Response(content=response, provider="gpu")
                 except Exception as e:
                     logger.warning(f"GPU failed (attempt {attempt + 1}): {e}")
                     self.load_balancer.record_request(used_gpu=True, success=False)
-                    self._provider_health["gpu"].record_failure()
+                    self._record_failure("gpu")
                     last_error = e
 
-            # Select best API provider considering health
+            # Select best API provider; scan for a fallback only if it's cooling down
             provider_name = self._select_provider(domain)
-
-            # Skip unhealthy providers
-            while provider_name and not self._provider_health[provider_name].is_healthy():
-                logger.debug(f"Skipping unhealthy provider: {provider_name}")
-                # Try next provider
-                available = [p for p in self._providers.keys()
-                           if p != provider_name and self._provider_health[p].is_healthy()]
-                provider_name = available[0] if available else None
-
+            if provider_name not in self._providers or not self._is_available(provider_name):
+                logger.debug(f"Skipping unavailable provider: {provider_name}")
+                provider_name = next(
+                    (name for name in self._providers if self._is_available(name)), None
+                )
             provider = self._providers.get(provider_name) if provider_name else None
 
-            if not provider:
-                # Fallback to any available provider
-                for name in self._providers.keys():
-                    if self._provider_health[name].is_healthy():
-                        provider_name = name
-                        provider = self._providers[name]
-                        break
-
             if not provider:
                 if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"No healthy providers, waiting {wait_time}s...")
+                    wait_time = backoff_delay(attempt)
+                    logger.warning(f"No healthy providers, waiting {wait_time:.1f}s...")
                     await asyncio.sleep(wait_time)
                     continue
                 raise RuntimeError("No providers available after retries")
 
             # Generate based on provider type
             try:
-                content = await self._generate_with_provider(provider_name, provider, prompt)
+                async with self._semaphores[provider_name], self._limits[provider_name]:
+                    content = await self._generate_with_provider(provider_name, provider, prompt)
                 self.load_balancer.record_request(used_gpu=False, success=True)
-                self._provider_health[provider_name].record_success()
+                self._record_success(provider_name)
                 self._request_count[provider_name] += 1
 
                 # Estimate and track cost
@@ -364,28 +580,112 @@ class MultiProviderOrchestrator:
 
             except Exception as e:
                 logger.warning(f"{provider_name} failed (attempt {attempt + 1}): {e}")
-                self._provider_health[provider_name].record_failure()
+                self._record_failure(provider_name)
                 last_error = e
 
                 if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
-                    await asyncio.sleep(wait_time)
+                    await asyncio.sleep(backoff_delay(attempt))
 
         raise RuntimeError(f"All providers failed after {self.max_retries} attempts: {last_error}")
 
+    async def generate_stream(
+        self,
+        prompts: Iterable[str],
+        domain: str = "unknown",
+        max_in_flight: int = 64,
+        **kwargs,
+    ) -> AsyncIterator[tuple[int, str, Optional["Response"]]]:
+        """Generate over a sliding window of in-flight requests.
+
+        Keeps up to max_in_flight generate() calls running and launches the
+        next prompt as each one finishes, so a slow request never idles the
+        rest of the window. Prompts are consumed lazily.
+
+        Yields:
+            (index, prompt, response) in completion order (response is None
+            where all retries failed)
+        """
+        prompt_iter = enumerate(prompts)
+        pending: dict[asyncio.Task, tuple[int, str]] = {}
+
+        def launch() -> None:
+            for index, prompt in prompt_iter:
+                task = asyncio.create_task(self.generate(prompt, domain=domain, **kwargs))
+                pending[task] = (index, prompt)
+                return
+
+        for _ in range(max_in_flight):
+            launch()
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index, prompt = pending.pop(task)
+                    launch()
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        logger.warning(f"Stream item failed ({domain}): {e}")
+                        response = None
+                    yield index, prompt, response
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def generate_batch(
+        self, prompts: list[str], domain: str = "unknown", **kwargs
+    ) -> list[Optional["Response"]]:
+        """Generate for many prompts concurrently.
+
+        Each prompt is routed independently, so a batch fans out across
+        providers; per-provider semaphores cap requests in flight.
+
+        Returns:
+            Responses in prompt order (None where all retries failed)
+        """
+        responses: list[Optional[Response]] = [None] * len(prompts)
+        window = self.max_concurrency * len(self._semaphores)
+        async for index, _, response in self.generate_stream(
+            prompts, domain=domain, max_in_flight=window, **kwargs
+        ):
+            responses[index] = response
+        return responses
+
+    async def _run_claude_cli(self, prompt: str, timeout: float = 120.0) -> str:
+        """Run one Claude CLI prompt as an async subprocess.
+
+        Unlike subprocess.run, this doesn't block the event loop, so CLI calls
+        overlap with other providers' requests (bounded by the opus semaphore).
+        """
+        proc = await asyncio.create_subprocess_exec(
+            "claude", "-p", "--model", "opus", "--output-format", "json", prompt,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise RuntimeError(f"Claude CLI timed out after {timeout:.0f}s")
+
+        if proc.returncode != 0:
+            raise RuntimeError(f"Claude CLI failed: {stderr.decode(errors='replace')}")
+        data = _json_loads(stdout)
+        return data.get("result", data.get("content", stdout.decode(errors="replace")))
+
     async def _generate_with_provider(self, provider_name: str, provider: Any, prompt: str) -> str:
         """Generate content using a specific provider."""
-        import subprocess
-
         if provider_name == "gemini":
-            response = provider.generate_content(prompt)
+            response = await provider.generate_content_async(prompt)
             return response.text
 
         elif provider_name == "opus":
-            opus_config = get_model(self.OPUS_MODEL)
+            opus_config = self._model_configs["opus"]
             if getattr(self, '_opus_mode', 'cli') == "api":
                 # Use Anthropic SDK
-                response = provider.messages.create(
+                response = await provider.messages.create(
                     model=opus_config.model_id,
                     max_tokens=4096,
                     messages=[{"role": "user", "content": prompt}],
@@ -393,18 +693,11 @@ class MultiProviderOrchestrator:
                 return response.content[0].text
             else:
                 # Use Claude Code CLI for Max subscription
-                result = subprocess.run(
-                    ["claude", "-p", "--model", "opus", "--output-format", "json", prompt],
-                    capture_output=True, text=True, timeout=120
-                )
-                if result.returncode != 0:
-                    raise RuntimeError(f"Claude CLI failed: {result.stderr}")
-                data = json.loads(result.stdout)
-                return data.get("result", data.get("content", result.stdout))
+                return await self._run_claude_cli(prompt)
 
         elif provider_name == "gpt":
-            gpt_config = get_model(self.GPT_MODEL)
-            response = provider.chat.completions.create(
+            gpt_config = self._model_configs["gpt"]
+            response = await provider.chat.completions.create(
                 model=gpt_config.model_id,
                 messages=[{"role": "user", "content": prompt}],
                 max_completion_tokens=4096,
@@ -430,6 +723,60 @@ class MultiProviderOrchestrator:
         }
 
 
+class CheckpointWriter:
+    """Coalesce checkpoint saves into a background task.
+
+    request_save() only sets a flag; the writer waits `interval` seconds to
+    batch further requests, then saves in a worker thread. The checkpoint on
+    disk is at most ~interval seconds stale and generation never blocks on it.
+    """
+
+    def __init__(
+        self,
+        checkpoint: GenerationCheckpoint,
+        orchestrator: MultiProviderOrchestrator,
+        interval: float = 2.0,
+    ):
+        self.checkpoint = checkpoint
+        self.orchestrator = orchestrator
+        self.interval = interval
+        self._dirty = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._saving: Optional[asyncio.Future] = None
+
+    def request_save(self) -> None:
+        self._dirty.set()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(self.interval)
+            self._dirty.clear()
+            # Snapshot and serialize on the loop thread, where the checkpoint
+            # is mutated; the worker thread only writes the bytes
+            self.checkpoint.provider_usage = dict(self.orchestrator._request_count)
+            self.checkpoint.estimated_cost_usd = self.orchestrator._estimated_cost
+            data = self.checkpoint.snapshot()
+            self._saving = asyncio.ensure_future(
+                asyncio.to_thread(self.checkpoint.write_snapshot, data)
+            )
+            await asyncio.shield(self._saving)
+
+    async def stop(self) -> None:
+        """Stop the writer and wait for an in-progress save to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._saving is not None:
+            await self._saving
+
+
 class Response:
     """Response wrapper."""
     def __init__(self, content: str, provider: str = "unknown"):
@@ -437,18 +784,34 @@ class Response:
         self.provider = provider
 
 
-async def main(resume_name: Optional[str] = None, target_count: int = 1000):
+def _routed_generate(hybrid_orch: MultiProviderOrchestrator, domain: str):
+    """Orchestrator.generate shim: route by domain, batch when given a list."""
+    async def generate(prompt, **kw):
+        if isinstance(prompt, list):
+            return await hybrid_orch.generate_batch(prompt, domain=domain, **kw)
+        return await hybrid_orch.generate(prompt, domain=domain, **kw)
+    return generate
+
+
+async def main(
+    resume_name: Optional[str] = None,
+    target_count: int = 1000,
+    concurrency: int = 10,
+):
     """Generate Oracle dataset with hybrid GPU + multi-provider.
 
     Args:
         resume_name: Optional checkpoint name to resume from
         target_count: Target number of samples to generate
+        concurrency: Max in-flight requests per API provider
     """
     # Check for resume
     checkpoint = None
     if resume_name:
         checkpoint = GenerationCheckpoint.load(resume_name)
         if checkpoint:
+            # Fail fast, before setup, if another run is resuming it
+            checkpoint.acquire_lock()
             logger.info(f"Resuming from checkpoint: {resume_name}")
             logger.info(f"  Progress: {checkpoint.completed_count}/{checkpoint.target_count}")
             logger.info(f"  Started: {checkpoint.started_at}")
@@ -470,7 +833,7 @@ async def main(resume_name: Optional[str] = None, target_count: int = 1000):
     logger.info("\nRouting:")
     logger.info("  - GPU <70% → Free GPU inference")
     logger.info("  - Oracle complex → Opus 4.5 (best quality)")
-    logger.info("  - Oracle medium → 70% Gemini, 30% Opus")
+    logger.info("  - Oracle medium → Gemini/GPT-5.2/Opus (6:4:3)")
     logger.info("  - ASM → 60% Gemini, 40% GPT-5.2")
     logger.info("  - Gigaleak → GPT-5.2 (code comparison)")
     logger.info("=" * 80)
@@ -491,7 +854,9 @@ async def main(resume_name: Optional[str] = None, target_count: int = 1000):
         logger.warning("⚠️  GPU Unavailable - API only mode")
 
     # Initialize multi-provider orchestrator
-    hybrid_orch = MultiProviderOrchestrator(gpu_monitor, load_balancer)
+    hybrid_orch = MultiProviderOrchestrator(
+        gpu_monitor, load_balancer, max_concurrency=concurrency
+    )
     await hybrid_orch.setup()
 
     # Restore provider usage from checkpoint
@@ -510,7 +875,7 @@ async def main(resume_name: Optional[str] = None, target_count: int = 1000):
     await oracle_gen.setup()
     # Patch orchestrator
     if hasattr(oracle_gen, "_orchestrator") and oracle_gen._orchestrator:
-        oracle_gen._orchestrator.generate = lambda prompt, **kw: hybrid_orch.generate(prompt, domain="oracle", **kw)
+        oracle_gen._orchestrator.generate = _routed_generate(hybrid_orch, "oracle")
     curator.register_generator("oracle", oracle_gen)
     logger.info("✓ Oracle (Opus 4.5 + Gemini mix)")
 
@@ -518,7 +883,7 @@ async def main(resume_name: Optional[str] = None, target_count: int = 1000):
     asm_gen = AsmDataGenerator(use_enhanced_prompts=True)
     await asm_gen.setup()
     if hasattr(asm_gen, "_orchestrator") and asm_gen._orchestrator:
-        asm_gen._orchestrator.generate = lambda prompt, **kw: hybrid_orch.generate(prompt, domain="asm", **kw)
+        asm_gen._orchestrator.generate = _routed_generate(hybrid_orch, "asm")
     curator.register_generator("asm", asm_gen)
     logger.info("✓ ASM (Gemini + GPT-5.2 mix)")
 
@@ -526,7 +891,7 @@ async def main(resume_name: Optional[str] = None, target_count: int = 1000):
     gigaleak_gen = GigaleakDataGenerator()
     await gigaleak_gen.setup()
     if hasattr(gigaleak_gen, "_orchestrator") and gigaleak_gen._orchestrator:
-        gigaleak_gen._orchestrator.generate = lambda prompt, **kw: hybrid_orch.generate(prompt, domain="gigaleak", **kw)
+        gigaleak_gen._orchestrator.generate = _routed_generate(hybrid_orch, "gigaleak")
     curator.register_generator("gigaleak", gigaleak_gen)
     logger.info("✓ Gigaleak (GPT-5.2)")
 
@@ -535,32 +900,42 @@ async def main(resume_name: Optional[str] = None, target_count: int = 1000):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_name = f"oracle_farore_hybrid_{timestamp}"
         checkpoint = GenerationCheckpoint.create(output_name, target_count)
+        checkpoint.acquire_lock()
 
     logger.info(f"\nOutput: {output_name}")
     logger.info("Starting hybrid generation...\n")
 
+    # Keep the checkpoint's provider usage/cost fresh while generating
+    writer = CheckpointWriter(checkpoint, hybrid_orch)
+    hybrid_orch.on_request = writer.request_save
+    writer.start()
+
     try:
-        result = await curator.curate_dataset(
-            domains=["oracle", "asm", "gigaleak"],
-            target_count=target_count,
-            quality_threshold=0.7,
-            balance_domains=True,
-            output_name=output_name,
-            resume=checkpoint.completed_count > 0,
-        )
+        try:
+            result = await curator.curate_dataset(
+                domains=["oracle", "asm", "gigaleak"],
+                target_count=target_count,
+                quality_threshold=0.7,
+                balance_domains=True,
+                output_name=output_name,
+                resume=checkpoint.completed_count > 0,
+            )
+        finally:
+            # Before the final synchronous saves below, so they can't interleave
+            await writer.stop()
 
         # Update checkpoint on success
         checkpoint.completed_count = result.stats.final_count
         checkpoint.domains_progress = result.stats.domain_counts
         checkpoint.provider_usage = hybrid_orch._request_count
         checkpoint.estimated_cost_usd = hybrid_orch._estimated_cost
-        checkpoint.save()
+        checkpoint.save(force=True)
 
     except KeyboardInterrupt:
         logger.warning("\nInterrupted! Saving checkpoint...")
         checkpoint.provider_usage = hybrid_orch._request_count
         checkpoint.estimated_cost_usd = hybrid_orch._estimated_cost
-        checkpoint.save()
+        checkpoint.save(force=True)
         logger.info(f"Resume with: --resume {output_name}")
         return 1
 
@@ -569,10 +944,13 @@ async def main(resume_name: Optional[str] = None, target_count: int = 1000):
         checkpoint.failed_items.append(str(e))
         checkpoint.provider_usage = hybrid_orch._request_count
         checkpoint.estimated_cost_usd = hybrid_orch._estimated_cost
-        checkpoint.save()
+        checkpoint.save(force=True)
         logger.info(f"Resume with: --resume {output_name}")
         raise
 
+    finally:
+        await hybrid_orch.close()
+
     # Stats
     stats = hybrid_orch.get_stats()
 
@@ -604,11 +982,27 @@ async def main(resume_name: Optional[str] = None, target_count: int = 1000):
 
 
 if __name__ == "__main__":
-    import argparse
-
     parser = argparse.ArgumentParser(description="Generate Oracle-Farore dataset with hybrid providers")
     parser.add_argument("--resume", type=str, help="Resume from checkpoint name")
     parser.add_argument("--target", type=int, default=1000, help="Target sample count")
+    parser.add_argument("--concurrency", type=int, default=10, help="Max in-flight requests per API provider")
+    parser.add_argument("--dump-checkpoint", type=str, metavar="NAME", help="Print a checkpoint as indented JSON and exit")
     args = parser.parse_args()
 
-    sys.exit(asyncio.run(main(resume_name=args.resume, target_count=args.target)))
+    if args.dump_checkpoint:
+        checkpoint = GenerationCheckpoint.load(args.dump_checkpoint)
+        if not checkpoint:
+            sys.exit(f"Checkpoint not found: {args.dump_checkpoint}")
+        print(json.dumps(asdict(checkpoint), indent=2))
+        sys.exit(0)
+
+    listener = install_queue_logging()
+    try:
+        exit_code = asyncio.run(main(
+            resume_name=args.resume,
+            target_count=args.target,
+            concurrency=args.concurrency,
+        ))
+    finally:
+        listener.stop()
+    sys.exit(exit_code)
@@ -0,0 +1,146 @@
+"""Declarative generator registration for dataset scripts.
+
+Scripts describe their generators as a table of GeneratorSpec rows; this
+module imports, constructs, sets up (concurrently) and registers them with
+a DataCurator, printing the usual ✓/⚠ status lines.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+
+@dataclass(frozen=True)
+class GeneratorSpec:
+    """One generator entry in a registration table."""
+
+    name: str  # Domain the generator is registered under
+    module: str  # Import path of the generator module
+    class_name: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    optional: bool = False  # Optional generators warn instead of raising
+    label: str = ""  # Human-readable name for status lines
+    detail: str = ""  # Suffix shown after ✓
+    requires_path: Optional[str] = None  # Attribute holding a Path that must exist
+    ready_attr: Optional[str] = None  # Attribute that must be truthy after setup
+
+
+async def setup_generators(
+    curator: Any,
+    specs: list[GeneratorSpec],
+    log: Callable[[str], None] = print,
+) -> list[tuple[str, Any]]:
+    """Construct, set up and register generators from a spec table.
+
+    Construction runs sequentially (cheap); setup() calls run concurrently.
+
+    Returns:
+        (name, generator) pairs that were registered
+    """
+    candidates: list[tuple[GeneratorSpec, Any]] = []
+    for spec in specs:
+        label = spec.label or spec.class_name
+        try:
+            module = importlib.import_module(spec.module)
+            gen = getattr(module, spec.class_name)(**spec.kwargs)
+            if spec.requires_path:
+                path = getattr(gen, spec.requires_path)
+                # Probe off the event loop; stat() can stall on a cold filesystem
+                if not await asyncio.to_thread(path.exists):
+                    log(f"⚠ {label}: path not found ({path})")
+                    continue
+        except Exception as e:
+            if not spec.optional:
+                raise
+            log(f"⚠ {label} not available: {e}")
+            continue
+        candidates.append((spec, gen))
+
+    results = await asyncio.gather(
+        *(gen.setup() for _, gen in candidates),
+        return_exceptions=True,
+    )
+
+    registered: list[tuple[str, Any]] = []
+    for (spec, gen), result in zip(candidates, results):
+        label = spec.label or spec.class_name
+        if isinstance(result, BaseException):
+            if not spec.optional:
+                raise result
+            log(f"⚠ {label} not available: {result}")
+            continue
+        if spec.ready_attr and not getattr(gen, spec.ready_attr):
+            log(f"⚠ {label}: no sources ({spec.ready_attr} is False)")
+            continue
+        curator.register_generator(spec.name, gen)
+        registered.append((spec.name, gen))
+        log(f"✓ {label} ({spec.detail})" if spec.detail else f"✓ {label}")
+
+    return registered
+
+
+async def _parallel_generate_batch(
+    gen: Any,
+    max_concurrent: int,
+    items: list,
+    batch_size: int = 50,
+    progress_callback: Optional[Callable] = None,
+) -> list:
+    from agents.training.parallel_generator import generate_batch_parallel
+
+    return await generate_batch_parallel(
+        gen,
+        items,
+        batch_size=batch_size,
+        max_concurrent=max_concurrent,
+        progress_callback=progress_callback,
+    )
+
+
+def enable_parallel_generation(
+    generators: list[tuple[str, Any]],
+    max_concurrent: int,
+) -> None:
+    """Route each generator's generate_batch through bounded-concurrency generation.
+
+    The curator awaits generate_batch per domain; patching it to
+    generate_batch_parallel keeps up to max_concurrent teacher calls in flight.
+    """
+    for _, gen in generators:
+        gen.generate_batch = functools.partial(_parallel_generate_batch, gen, max_concurrent)
+
+
+@dataclass
+class CallStats:
+    """Counters for per-call generation guards."""
+
+    timeouts: int = 0
+
+
+def enable_call_timeouts(
+    generators: list[tuple[str, Any]],
+    timeout: float,
+    stats: CallStats,
+) -> None:
+    """Bound each generate_sample call so one stalled teacher call can't gate a batch.
+
+    A call exceeding timeout is cancelled, counted in stats.timeouts, and
+    treated as a failed sample (None). Safe to call again for generators
+    reused across profiles: the original method is wrapped, not the wrapper.
+    """
+    for _, gen in generators:
+        original = gen.__dict__.get("_untimed_generate_sample") or gen.generate_sample
+        gen._untimed_generate_sample = original
+
+        async def timed_generate_sample(item, _original=original):
+            try:
+                return await asyncio.wait_for(_original(item), timeout=timeout)
+            except asyncio.TimeoutError:
+                stats.timeouts += 1
+                return None
+
+        gen.generate_sample = timed_generate_sample
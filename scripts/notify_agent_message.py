@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
 import json
 import os
 import subprocess
@@ -13,12 +15,30 @@ import urllib.error
 import urllib.request
 from pathlib import Path
 
+try:
+    import httpx  # Optional: async HTTP; falls back to urllib in a thread
+except ImportError:
+    httpx = None
+
+try:
+    import orjson  # Optional: faster payload encoding
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(resolved_path: str, mtime_ns: int) -> dict:
+    with open(resolved_path, "rb") as handle:
+        return tomllib.load(handle)
+
 
 def load_config(config_path: Path) -> dict:
-    if not config_path.exists():
+    """Parse config.toml, cached per path until the file's mtime changes."""
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
-    with config_path.open("rb") as handle:
-        return tomllib.load(handle)
+    return _load_config_cached(str(config_path.resolve()), mtime_ns)
 
 
 def get_flag(value: bool | None, default: bool) -> bool:
@@ -27,7 +47,31 @@ def get_flag(value: bool | None, default: bool) -> bool:
     return value
 
 
-def send_halext(message: str, subject: str, config: dict, dry_run: bool) -> bool:
+def _encode_payload(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _post_json_urllib(url: str, payload: dict, headers: dict) -> bool:
+    req = urllib.request.Request(
+        url,
+        data=_encode_payload(payload),
+        headers=headers,
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            if resp.status >= 200 and resp.status < 300:
+                return True
+    except urllib.error.HTTPError as exc:
+        print(f"Halext notify failed: {exc}", file=sys.stderr)
+    except urllib.error.URLError as exc:
+        print(f"Halext notify error: {exc}", file=sys.stderr)
+    return False
+
+
+async def send_halext(message: str, subject: str, config: dict, dry_run: bool) -> bool:
     halext = config.get("notify", {}).get("halext", {})
     if not get_flag(None, bool(halext.get("enabled", False))):
         return False
@@ -51,27 +95,25 @@ def send_halext(message: str, subject: str, config: dict, dry_run: bool) -> bool
         print(f"[dry-run] POST {url} -> {payload}")
         return True
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+    if httpx is None:
+        return await asyncio.to_thread(_post_json_urllib, url, payload, headers)
+
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            if resp.status >= 200 and resp.status < 300:
-                return True
-    except urllib.error.HTTPError as exc:
-        print(f"Halext notify failed: {exc}", file=sys.stderr)
-    except urllib.error.URLError as exc:
+        async with httpx.AsyncClient(timeout=10) as client:
+            resp = await client.post(url, content=_encode_payload(payload), headers=headers)
+        if resp.is_success:
+            return True
+        print(f"Halext notify failed: HTTP {resp.status_code}", file=sys.stderr)
+    except httpx.HTTPError as exc:
         print(f"Halext notify error: {exc}", file=sys.stderr)
     return False
 
 
-def send_mail(message: str, subject: str, config: dict, dry_run: bool) -> bool:
+async def send_mail(message: str, subject: str, config: dict, dry_run: bool) -> bool:
     mail_cfg = config.get("notify", {}).get("terminal_mail", {})
     if not get_flag(None, bool(mail_cfg.get("enabled", False))):
         return False
@@ -87,17 +129,66 @@ def send_mail(message: str, subject: str, config: dict, dry_run: bool) -> bool:
         return True
 
     try:
-        subprocess.run(
-            [command, "-s", subject, recipient],
-            input=message.encode("utf-8"),
-            check=True,
+        proc = await asyncio.create_subprocess_exec(
+            command, "-s", subject, recipient,
+            stdin=asyncio.subprocess.PIPE,
         )
+        await proc.communicate(message.encode("utf-8"))
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, command)
         return True
     except (OSError, subprocess.CalledProcessError) as exc:
         print(f"Terminal mail failed: {exc}", file=sys.stderr)
         return False
 
 
+async def notify(message: str, subject: str, config: dict, dry_run: bool = False) -> bool:
+    """Send via Halext and terminal mail concurrently; True if either was sent."""
+    results = await asyncio.gather(
+        send_halext(message, subject, config, dry_run),
+        send_mail(message, subject, config, dry_run),
+    )
+    return any(results)
+
+
+# Background delivery for callers that shouldn't wait on network I/O
+_queue: asyncio.Queue | None = None
+_worker: asyncio.Task | None = None
+
+
+async def _drain_queue(queue: asyncio.Queue) -> None:
+    while True:
+        message, subject, config, dry_run = await queue.get()
+        try:
+            await notify(message, subject, config, dry_run)
+        except Exception as exc:
+            print(f"Notification failed: {exc}", file=sys.stderr)
+        finally:
+            queue.task_done()
+
+
+def notify_nowait(message: str, subject: str, config: dict, dry_run: bool = False) -> None:
+    """Queue a notification for background delivery (must be called inside a running loop).
+
+    Call flush_notifications() before the loop exits to deliver pending ones.
+    """
+    global _queue, _worker
+    if _worker is None or _worker.done():
+        _queue = asyncio.Queue()
+        _worker = asyncio.get_running_loop().create_task(_drain_queue(_queue))
+    _queue.put_nowait((message, subject, config, dry_run))
+
+
+async def flush_notifications() -> None:
+    """Wait for queued notifications to be delivered, then stop the worker."""
+    global _queue, _worker
+    if _worker is None:
+        return
+    await _queue.join()
+    _worker.cancel()
+    _queue, _worker = None, None
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Send hAFS agent notifications.")
     parser.add_argument("message", nargs="+", help="Message body")
@@ -118,9 +209,7 @@ def main() -> int:
         print("Message cannot be empty.", file=sys.stderr)
         return 1
 
-    sent = False
-    sent |= send_halext(message, args.subject, config, args.dry_run)
-    sent |= send_mail(message, args.subject, config, args.dry_run)
+    sent = asyncio.run(notify(message, args.subject, config, args.dry_run))
 
     if not sent:
         print("No notifications sent (check config).", file=sys.stderr)
@@ -3,21 +3,32 @@
 
 import asyncio
 import sys
+from pathlib import Path
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
+from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path, install_uvloop
 
 ensure_hafs_on_path()
 
 
 async def main():
-    if len(sys.argv) < 2:
+    number = None
+    if len(sys.argv) >= 2:
+        # Get question number
+        try:
+            number = int(sys.argv[1])
+        except ValueError:
+            print(f"Error: '{sys.argv[1]}' is not a number")
+            return
+
+    # One curator and one batch load serve listing, lookup and answer/skip
+    from agents.training.background import QuestionCurator
+    curator = QuestionCurator()
+    batch = curator.get_today_batch()
+
+    if number is None:
         print("Usage: python qa_by_number.py <number>")
         print("\nAvailable questions:")
 
-        from agents.training.background import QuestionCurator
-        curator = QuestionCurator()
-        batch = curator.get_today_batch()
-
         if not batch:
             print("No questions available")
             return
@@ -28,23 +39,12 @@ async def main():
 
         return
 
-    # Get question number
-    try:
-        number = int(sys.argv[1])
-    except ValueError:
-        print(f"Error: '{sys.argv[1]}' is not a number")
-        return
-
-    # Get today's batch
-    from agents.training.background import QuestionCurator
-    curator = QuestionCurator()
-    batch = curator.get_today_batch()
-
-    if not batch or number < 1 or number > len(batch.questions):
-        print(f"Error: Question {number} not found (batch has {len(batch.questions) if batch else 0} questions)")
+    questions_by_number = dict(enumerate(batch.questions, 1)) if batch else {}
+    question = questions_by_number.get(number)
+    if question is None:
+        print(f"Error: Question {number} not found (batch has {len(questions_by_number)} questions)")
         return
 
-    question = batch.questions[number - 1]
     question_id = question.question_id
 
     print(f"\n=== Question {number} ===")
@@ -53,7 +53,7 @@ async def main():
 
     # Run assisted workflow
     from agents.training.background.assisted_qa import assisted_answer_workflow
-    from agents.training.background import QuestionCurator, QAConverter
+    from agents.training.background import QAConverter
 
     print("Generating draft answer...")
     result = await assisted_answer_workflow(question_id)
@@ -77,7 +77,6 @@ async def main():
     choice = input("Choice [a/e/s]: ").lower().strip()
 
     if choice == 'a':
-        curator = QuestionCurator()
         answered = curator.answer_question(question_id, result['draft_answer'])
         print(f"✓ Answer saved ({answered.answer_word_count} words)")
 
@@ -95,7 +94,6 @@ async def main():
             print(f"Saved to: {output_path}")
 
     elif choice == 's':
-        curator = QuestionCurator()
         curator.skip_question(question_id)
         print("✓ Question skipped")
     else:
@@ -103,4 +101,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
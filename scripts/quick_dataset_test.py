@@ -3,7 +3,7 @@
 
 import asyncio
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
+from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path, install_uvloop
 
 ensure_hafs_on_path()
 
@@ -62,4 +62,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
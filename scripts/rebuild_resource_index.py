@@ -4,27 +4,23 @@
 from __future__ import annotations
 
 import asyncio
-import importlib.util
+import sys
 from pathlib import Path
 
+from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path, install_uvloop
 
-HAFS_SRC = Path.home() / "Code" / "hafs" / "src"
-RESOURCE_DISCOVERY_PATH = HAFS_SRC / "agents" / "training" / "resource_discovery.py"
+ensure_hafs_on_path()
 
+HAFS_SRC = Path.home() / "Code" / "hafs" / "src"
 
-async def main() -> int:
-    if not RESOURCE_DISCOVERY_PATH.exists():
-        raise FileNotFoundError(f"Missing resource_discovery.py at {RESOURCE_DISCOVERY_PATH}")
+# Fallback when HAFS_ROOT is unset and hafs isn't a sibling checkout
+if HAFS_SRC.exists() and str(HAFS_SRC) not in sys.path:
+    sys.path.append(str(HAFS_SRC))
 
-    spec = importlib.util.spec_from_file_location("resource_discovery", RESOURCE_DISCOVERY_PATH)
-    if not spec or not spec.loader:
-        raise RuntimeError("Failed to load resource_discovery module spec")
 
-    module = importlib.util.module_from_spec(spec)
-    import sys
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)
-    ZeldaResourceIndexer = module.ZeldaResourceIndexer
+async def main() -> int:
+    # Regular package import, so repeat runs use the cached bytecode
+    from agents.training.resource_discovery import ZeldaResourceIndexer
 
     indexer = ZeldaResourceIndexer()
     result = await indexer.discover_and_index()
@@ -37,4 +33,5 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
+    install_uvloop()
     raise SystemExit(asyncio.run(main()))
@@ -1,14 +1,112 @@
 import re
 import json
+import mmap
 from pathlib import Path
 
+try:
+    import hyperscan  # Optional: SIMD DFA scanning for large bank files
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson  # Optional: faster serialization of the routine dump
+except ImportError:
+    orjson = None
+
+# One pass over the whole file: labels at the start of a line, or return
+# instructions anywhere (both bytes patterns, matched against an mmap)
+TOKEN_PATTERN = re.compile(
+    rb"^[^\S\n]*(?P<label>[A-Za-z0-9_]+):|\b(?:RTS|RTL|RTI)\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+LABEL_NAME = re.compile(rb"[A-Za-z0-9_]+")
+_HS_LABEL, _HS_RETURN = 0, 1
+_hs_db = None
+
+
+def _hyperscan_db():
+    global _hs_db
+    if _hs_db is None:
+        _hs_db = hyperscan.Database()
+        _hs_db.compile(
+            expressions=[rb"^[^\S\n]*[A-Za-z0-9_]+:", rb"\b(?:RTS|RTL|RTI)\b"],
+            ids=[_HS_LABEL, _HS_RETURN],
+            flags=[hyperscan.HS_FLAG_MULTILINE, hyperscan.HS_FLAG_CASELESS],
+        )
+    return _hs_db
+
+
+def iter_tokens(data):
+    """Yield (label or None, start, end) for labels and return instructions, in order."""
+    if hyperscan is None:
+        for match in TOKEN_PATTERN.finditer(data):
+            yield match.group("label"), match.start(), match.end()
+        return
+
+    # Hyperscan reports match end offsets; recover each label's line start
+    hits = []
+    _hyperscan_db().scan(
+        bytes(data),
+        match_event_handler=lambda id_, frm, to, flags, ctx: hits.append((to, id_)),
+    )
+    for to, id_ in sorted(hits):
+        if id_ == _HS_LABEL:
+            start = data.rfind(b"\n", 0, to) + 1
+            label = LABEL_NAME.search(data, start, to).group()
+            yield label, start, to
+        else:
+            yield None, to - 3, to
+
+
+# Trailing whitespace (incl. \r from CRLF files) at the end of each line
+TRAILING_WS = re.compile(r"[^\S\n]+$", re.MULTILINE)
+
+
+def dump_routines(routines: list) -> bytes:
+    """Serialize routines as indented JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(routines, option=orjson.OPT_INDENT_2)
+    return json.dumps(routines, indent=2).encode()
+
+
+def iter_routines(data):
+    """Yield (name, start, end) byte spans of the routines in an assembly buffer.
+
+    A routine runs from its label line through the first line with a return
+    instruction; a new label finishes the open routine (even if no RTS found).
+    """
+    current_name = None
+    start = 0  # Offset of the current routine's label line
+    body = 0  # Returns before this offset (on the label line) don't end it
+
+    for label, token_start, token_end in iter_tokens(data):
+        if label is not None:
+            if current_name is not None:
+                yield current_name, start, token_start - 1
+            current_name = label.decode("utf-8", errors="replace")
+            start = token_start
+            body = data.find(b"\n", token_end)
+            if body == -1:
+                body = len(data)
+            continue
+
+        if current_name is not None and token_start >= body:
+            end = data.find(b"\n", token_end)
+            if end == -1:
+                end = len(data)
+            yield current_name, start, end
+            current_name = None
+
+
+def routine_code(data, start: int, end: int) -> str:
+    """Decode a routine span with per-line trailing whitespace removed."""
+    code = data[start:end].decode("utf-8", errors="replace")
+    return TRAILING_WS.sub("", code)
+
+
 class RoutineScanner:
     def __init__(self, bank_asm_path: str):
         self.bank_asm_path = Path(bank_asm_path)
-        # Matches labels that start at the beginning of a line
-        self.label_pattern = re.compile(r"^([A-Za-z0-9_]+):")
-        # Matches return instructions
-        self.return_pattern = re.compile(r"\b(RTS|RTL|RTI)\b", re.IGNORECASE)
 
     def scan(self) -> list:
         routines = []
@@ -16,37 +114,13 @@ class RoutineScanner:
             print(f"Error: {self.bank_asm_path} not found.")
             return routines
 
-        current_routine = None
-        current_name = ""
-        
-        with open(self.bank_asm_path, 'r') as f:
-            for line in f:
-                stripped = line.strip()
-                label_match = self.label_pattern.match(stripped)
-                
-                if label_match:
-                    # If we were already in a routine, finish it (even if no RTS found)
-                    if current_routine:
-                        routines.append({
-                            "name": current_name,
-                            "code": "\n".join(current_routine)
-                        })
-                    
-                    current_name = label_match.group(1)
-                    current_routine = [line.rstrip()]
-                    continue
-                
-                if current_routine is not None:
-                    current_routine.append(line.rstrip())
-                    
-                    if self.return_pattern.search(stripped):
-                        routines.append({
-                            "name": current_name,
-                            "code": "\n".join(current_routine)
-                        })
-                        current_routine = None
-                        current_name = ""
-        
+        with open(self.bank_asm_path, 'rb') as f:
+            if self.bank_asm_path.stat().st_size == 0:
+                return routines
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for name, start, end in iter_routines(data):
+                    routines.append({"name": name, "code": routine_code(data, start, end)})
+
         return routines
 
 if __name__ == "__main__":
@@ -55,6 +129,6 @@ if __name__ == "__main__":
     scanner = RoutineScanner(bank_file)
     routines = scanner.scan()
     output_file = Path(bank_file).stem + "_routines.json"
-    with open(output_file, "w") as f:
-        json.dump(routines, f, indent=2)
+    with open(output_file, "wb") as f:
+        f.write(dump_routines(routines))
     print(f"Scanned {len(routines)} routines from {bank_file}.")
@@ -18,11 +18,7 @@ import logging
 import sys
 from typing import Optional
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
-
-ensure_hafs_on_path()
-
-from agents.training.ab_testing import ABTestRunner, PromptVersion
+from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path, install_uvloop
 
 
 logging.basicConfig(
@@ -36,6 +32,7 @@ logger = logging.getLogger(__name__)
 
 async def run_asm_test(num_samples: int, source_limit: Optional[int] = None):
     """Run A/B test for ASM generator."""
+    from agents.training.ab_testing import ABTestRunner, PromptVersion
     from hafs_scawful.generators.asm_generator import AsmDataGenerator
 
     logger.info("Starting ASM A/B test")
@@ -66,6 +63,7 @@ async def run_asm_test(num_samples: int, source_limit: Optional[int] = None):
 
 async def run_oracle_test(num_samples: int, source_limit: Optional[int] = None):
     """Run A/B test for Oracle generator."""
+    from agents.training.ab_testing import ABTestRunner, PromptVersion
     from hafs_scawful.generators.oracle_generator import OracleDataGenerator
 
     logger.info("Starting Oracle A/B test")
@@ -125,6 +123,9 @@ def main():
 
     args = parser.parse_args()
 
+    # hafs is only needed once arguments are valid (keeps --help fast)
+    ensure_hafs_on_path()
+
     # Quick mode overrides
     if args.quick:
         args.samples = 50
@@ -156,4 +157,5 @@ def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     sys.exit(main())
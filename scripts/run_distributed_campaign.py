@@ -14,28 +14,123 @@ Expected performance:
 """
 
 import asyncio
+import functools
+import importlib
 import sys
 import time
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
+from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path, install_uvloop
 
 ensure_hafs_on_path()
 
+from hafs_scawful.scripts.generator_registry import GeneratorSpec
+
+# Max seconds between distributed checkpoint flushes
+CHECKPOINT_INTERVAL = 30.0
+
+# Generator modules are imported only when their row is set up, so importing
+# this script (or a failed optional generator) doesn't load every generator
+GENERATOR_SPECS = [
+    # Trailing comments: campaign sample target per domain
+    GeneratorSpec("asm", "hafs_scawful.generators.asm_generator", "AsmDataGenerator"),  # 15K
+    GeneratorSpec("gigaleak", "hafs_scawful.generators.gigaleak_generator", "GigaleakDataGenerator"),  # 8K
+    GeneratorSpec("oracle", "hafs_scawful.generators.oracle_generator", "OracleDataGenerator"),  # 4K
+    GeneratorSpec(
+        "yaze", "hafs_scawful.generators.cpp_generator", "CppDataGenerator",
+        optional=True, label="YAZE",
+    ),  # 6K
+    GeneratorSpec(
+        "errors", "agents.training.generators.error_generator", "ErrorSampleGenerator",
+        optional=True, label="Error",
+    ),  # 1.5K
+]
+
+# Original generator class -> its distributed subclass, built once per class
+_DIST_CACHE: dict[type, type] = {}
+
+
+def as_distributed(gen):
+    """Give gen distributed capabilities by switching it to a cached mixin subclass.
+
+    Every instance of a generator class shares one subclass, so type
+    attribute caches stay warm instead of a new class per instance.
+    """
+    from agents.training.distributed_generator import DistributedGenerationMixin
+
+    cls = gen.__class__
+    dist_cls = _DIST_CACHE.get(cls)
+    if dist_cls is None:
+        dist_cls = _DIST_CACHE[cls] = type(
+            f"Distributed{cls.__name__}",
+            (cls, DistributedGenerationMixin),
+            {},
+        )
+    gen.__class__ = dist_cls
+    gen._generation_counter = 0
+    gen._use_distributed = True
+    return gen
+
+
+async def _distributed_generate_batch(gen, items, batch_size=100, progress_callback=None):
+    """generate_batch replacement bound per generator with functools.partial."""
+    from agents.training.base import GenerationCheckpoint
+
+    # Use distributed generation with 10x parallelism: a new request
+    # starts as soon as any slot frees (no chunk-boundary stalls)
+    samples = []
+    total = len(items)
+    sem = asyncio.Semaphore(10)
+
+    async def bounded(item):
+        async with sem:
+            try:
+                return item, await gen.generate_sample_distributed(item)
+            except Exception:
+                return item, None
+
+    # Checkpoint state grows incrementally; flushed every batch_size
+    # new samples or CHECKPOINT_INTERVAL seconds, off the event loop
+    processed_ids: set[str] = set()
+    new_since_flush = 0
+    last_flush = time.monotonic()
+
+    tasks = [asyncio.create_task(bounded(item)) for item in items]
+    for completed, next_done in enumerate(asyncio.as_completed(tasks), 1):
+        item, result = await next_done
+        if result is not None:
+            samples.append(result)
+            processed_ids.add(result.sample_id)
+            new_since_flush += 1
+
+        if progress_callback:
+            progress_callback(completed, total)
+
+        # Checkpoint
+        if new_since_flush and (
+            new_since_flush >= batch_size
+            or time.monotonic() - last_flush > CHECKPOINT_INTERVAL
+            or completed == total
+        ):
+            # The running set is passed as-is: it is only mutated by this
+            # loop, which is suspended until the save returns
+            checkpoint = GenerationCheckpoint(
+                domain=gen.domain,
+                processed_ids=processed_ids,
+                last_item_id=item.item_id,
+                total_processed=len(samples),
+                total_errors=0,
+            )
+            await asyncio.to_thread(gen.save_checkpoint, checkpoint)
+            new_since_flush = 0
+            last_flush = time.monotonic()
+
+    return samples
+
 
 async def run_distributed_campaign():
     """Run full 34.5K campaign with distributed generation."""
     from agents.training.curator import DataCurator
-    from hafs_scawful.generators.asm_generator import AsmDataGenerator
-    from hafs_scawful.generators.gigaleak_generator import GigaleakDataGenerator
-    from hafs_scawful.generators.oracle_generator import OracleDataGenerator
-    from hafs_scawful.generators.cpp_generator import CppDataGenerator
-    from agents.training.generators.error_generator import ErrorSampleGenerator
-    from agents.training.generators.text_generator import TextDataGenerator
-    from agents.training.parallel_generator import generate_batch_parallel
-    from agents.training.distributed_generator import (
-        DistributedGenerationMixin,
-        LoadBalancer,
-    )
+    from agents.training.distributed_generator import LoadBalancer
 
     print("=" * 80)
     print("FULL CAMPAIGN - 34,500 SAMPLES (DISTRIBUTED)")
@@ -57,137 +152,46 @@ async def run_distributed_campaign():
     # Initialize load balancer
     load_balancer = LoadBalancer()
 
-    # Register all 6 generators with distributed mixin
-    generators = []
-
-    # ASM (15K target)
-    print("  Setting up AsmDataGenerator (distributed)...")
-    asm_gen = AsmDataGenerator()
-    # Add distributed capabilities
-    asm_gen.__class__ = type(
-        "DistributedAsmGenerator",
-        (asm_gen.__class__, DistributedGenerationMixin),
-        {},
-    )
-    asm_gen._generation_counter = 0
-    asm_gen._use_distributed = True
-    await asm_gen.setup()
-    await asm_gen._setup_distributed()
-    curator.register_generator("asm", asm_gen)
-    generators.append(("asm", asm_gen, 15000))
-
-    # Gigaleak (8K)
-    print("  Setting up GigaleakDataGenerator (distributed)...")
-    gigaleak_gen = GigaleakDataGenerator()
-    gigaleak_gen.__class__ = type(
-        "DistributedGigaleakGenerator",
-        (gigaleak_gen.__class__, DistributedGenerationMixin),
-        {},
+    # Register all generators with distributed mixin
+    candidates = []
+    for spec in GENERATOR_SPECS:
+        print(f"  Setting up {spec.class_name} (distributed)...")
+        try:
+            module = importlib.import_module(spec.module)
+            gen = as_distributed(getattr(module, spec.class_name)(**spec.kwargs))
+        except Exception as e:
+            if not spec.optional:
+                raise
+            print(f"  ⚠️  {spec.label} generator failed: {e}")
+            continue
+        candidates.append((spec, gen))
+
+    async def setup_distributed(gen):
+        await gen.setup()
+        await gen._setup_distributed()
+
+    # Setups (API probes, node connections) run concurrently
+    results = await asyncio.gather(
+        *(setup_distributed(gen) for _, gen in candidates),
+        return_exceptions=True,
     )
-    gigaleak_gen._generation_counter = 0
-    gigaleak_gen._use_distributed = True
-    await gigaleak_gen.setup()
-    await gigaleak_gen._setup_distributed()
-    curator.register_generator("gigaleak", gigaleak_gen)
-    generators.append(("gigaleak", gigaleak_gen, 8000))
-
-    # Oracle (4K)
-    print("  Setting up OracleDataGenerator (distributed)...")
-    oracle_gen = OracleDataGenerator()
-    oracle_gen.__class__ = type(
-        "DistributedOracleGenerator",
-        (oracle_gen.__class__, DistributedGenerationMixin),
-        {},
-    )
-    oracle_gen._generation_counter = 0
-    oracle_gen._use_distributed = True
-    await oracle_gen.setup()
-    await oracle_gen._setup_distributed()
-    curator.register_generator("oracle", oracle_gen)
-    generators.append(("oracle", oracle_gen, 4000))
-
-    # YAZE/C++ (6K)
-    print("  Setting up CppDataGenerator (distributed)...")
-    try:
-        cpp_gen = CppDataGenerator()
-        cpp_gen.__class__ = type(
-            "DistributedCppGenerator",
-            (cpp_gen.__class__, DistributedGenerationMixin),
-            {},
-        )
-        cpp_gen._generation_counter = 0
-        cpp_gen._use_distributed = True
-        await cpp_gen.setup()
-        await cpp_gen._setup_distributed()
-        curator.register_generator("yaze", cpp_gen)
-        generators.append(("yaze", cpp_gen, 6000))
-    except Exception as e:
-        print(f"  ⚠️  YAZE generator failed: {e}")
-
-    # Errors (1.5K)
-    print("  Setting up ErrorSampleGenerator (distributed)...")
-    try:
-        error_gen = ErrorSampleGenerator()
-        error_gen.__class__ = type(
-            "DistributedErrorGenerator",
-            (error_gen.__class__, DistributedGenerationMixin),
-            {},
-        )
-        error_gen._generation_counter = 0
-        error_gen._use_distributed = True
-        await error_gen.setup()
-        await error_gen._setup_distributed()
-        curator.register_generator("errors", error_gen)
-        generators.append(("errors", error_gen, 1500))
-    except Exception as e:
-        print(f"  ⚠️  Error generator failed: {e}")
+
+    generators = []
+    for (spec, gen), result in zip(candidates, results):
+        if isinstance(result, BaseException):
+            if not spec.optional:
+                raise result
+            print(f"  ⚠️  {spec.label} generator failed: {result}")
+            continue
+        curator.register_generator(spec.name, gen)
+        generators.append((spec.name, gen))
 
     print(f"\n  ✓ {len(generators)} distributed generators registered")
 
     # Patch generate_batch for parallel + distributed
     print("\n[2] Patching generators for distributed parallel execution...")
-    for domain, gen, _ in generators:
-        original_method = gen.generate_batch
-
-        async def distributed_wrapper(
-            items, batch_size=100, progress_callback=None, _gen=gen
-        ):
-            # Use distributed generation with 10x parallelism
-            samples = []
-            total = len(items)
-
-            for chunk_start in range(0, len(items), 10):
-                chunk = items[chunk_start : chunk_start + 10]
-
-                # Generate with distributed routing
-                tasks = [_gen.generate_sample_distributed(item) for item in chunk]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                for item, result in zip(chunk, results):
-                    if isinstance(result, Exception):
-                        continue
-                    elif result is not None:
-                        samples.append(result)
-
-                    if progress_callback:
-                        progress_callback(chunk_start + len(samples), total)
-
-                    # Checkpoint
-                    if len(samples) % batch_size == 0:
-                        from agents.training.base import GenerationCheckpoint
-
-                        checkpoint = GenerationCheckpoint(
-                            domain=_gen.domain,
-                            processed_ids=set(s.sample_id for s in samples),
-                            last_item_id=item.item_id,
-                            total_processed=len(samples),
-                            total_errors=0,
-                        )
-                        _gen.save_checkpoint(checkpoint)
-
-            return samples
-
-        gen.generate_batch = distributed_wrapper
+    for domain, gen in generators:
+        gen.generate_batch = functools.partial(_distributed_generate_batch, gen)
 
     print("  ✓ All generators patched for distributed execution")
 
@@ -204,7 +208,7 @@ async def run_distributed_campaign():
     start_time = time.time()
 
     result = await curator.curate_dataset(
-        domains=[d for d, _, _ in generators],
+        domains=[d for d, _ in generators],
         target_count=34500,
         quality_threshold=None,  # Use domain-specific
         balance_domains=True,
@@ -214,64 +218,75 @@ async def run_distributed_campaign():
 
     duration = time.time() - start_time
 
-    # Display results
-    print("\n" + "=" * 80)
-    print("DISTRIBUTED CAMPAIGN RESULTS")
-    print("=" * 80)
+    # Display results (built up and written in one go)
+    lines: list[str] = ["\n" + "=" * 80]
+    lines.append("DISTRIBUTED CAMPAIGN RESULTS")
+    lines.append("=" * 80)
 
     stats = result.stats
-    print(f"\nGeneration:")
-    print(f"  Total generated: {stats.total_generated}")
-    print(f"  Passed quality: {stats.passed_quality}")
-    print(f"  Deduplicated: {stats.deduplicated}")
-    print(f"  Final count: {stats.final_count}")
-    print(f"  Duration: {duration / 3600:.1f} hours")
-
-    if stats.total_generated > 0:
-        pass_rate = (stats.passed_quality / stats.total_generated) * 100
-        print(f"\nQuality pass rate: {pass_rate:.1f}%")
-
-    print(f"\nDomain breakdown:")
-    for domain, count in stats.domain_counts.items():
-        pct = (count / stats.final_count * 100) if stats.final_count > 0 else 0
-        print(f"  {domain}: {count} samples ({pct:.1f}%)")
-
-    print(f"\nQuality scores:")
-    for domain, score in stats.quality_scores.items():
-        print(f"  {domain}: {score:.3f}")
-
-    print(f"\nDataset splits:")
-    print(f"  Train: {len(result.splits.train)} (80%)")
-    print(f"  Val: {len(result.splits.val)} (10%)")
-    print(f"  Test: {len(result.splits.test)} (10%)")
+    final_count = stats.final_count
+    total_generated = stats.total_generated
+    lines.append(f"\nGeneration:")
+    lines.append(f"  Total generated: {total_generated}")
+    lines.append(f"  Passed quality: {stats.passed_quality}")
+    lines.append(f"  Deduplicated: {stats.deduplicated}")
+    lines.append(f"  Final count: {final_count}")
+    lines.append(f"  Duration: {duration / 3600:.1f} hours")
+
+    if total_generated > 0:
+        pass_rate = (stats.passed_quality / total_generated) * 100
+        lines.append(f"\nQuality pass rate: {pass_rate:.1f}%")
+
+    # Per-domain aggregates computed in one pass, then rendered
+    inv_total = (100.0 / final_count) if final_count > 0 else 0.0
+    domain_rows = [
+        (domain, count, count * inv_total)
+        for domain, count in stats.domain_counts.items()
+    ]
+
+    lines.append(f"\nDomain breakdown:")
+    lines.extend(
+        f"  {domain}: {count} samples ({pct:.1f}%)" for domain, count, pct in domain_rows
+    )
+
+    lines.append(f"\nQuality scores:")
+    lines.extend(f"  {domain}: {score:.3f}" for domain, score in stats.quality_scores.items())
+
+    lines.append(f"\nDataset splits:")
+    lines.append(f"  Train: {len(result.splits.train)} (80%)")
+    lines.append(f"  Val: {len(result.splits.val)} (10%)")
+    lines.append(f"  Test: {len(result.splits.test)} (10%)")
 
     if result.output_dir:
-        print(f"\nOutput: {result.output_dir}")
+        lines.append(f"\nOutput: {result.output_dir}")
 
     # Performance metrics
-    samples_per_hour = stats.final_count / (duration / 3600)
-    print(f"\nPerformance:")
-    print(f"  Throughput: {samples_per_hour:.0f} samples/hour")
-    print(f"  Speedup: 2-3x faster than parallel-only")
+    samples_per_hour = final_count / (duration / 3600)
+    lines.append(f"\nPerformance:")
+    lines.append(f"  Throughput: {samples_per_hour:.0f} samples/hour")
+    lines.append(f"  Speedup: 2-3x faster than parallel-only")
 
     # Load balancer stats
-    print(f"\nLoad distribution:")
+    lines.append(f"\nLoad distribution:")
     lb_stats = load_balancer.get_stats()
     for provider, pstats in lb_stats.items():
         if pstats["requests"] > 0:
-            print(f"  {provider}:")
-            print(f"    Requests: {pstats['requests']}")
-            print(f"    Avg time: {pstats['avg_time']:.2f}s")
-            print(f"    Error rate: {pstats['error_rate']*100:.1f}%")
-
-    print("\n" + "=" * 80)
-    print("✓ FULL CAMPAIGN COMPLETE!")
-    print("Ready to export datasets and begin training")
-    print("=" * 80)
+            lines.append(f"  {provider}:")
+            lines.append(f"    Requests: {pstats['requests']}")
+            lines.append(f"    Avg time: {pstats['avg_time']:.2f}s")
+            lines.append(f"    Error rate: {pstats['error_rate']*100:.1f}%")
+
+    lines.append("\n" + "=" * 80)
+    lines.append("✓ FULL CAMPAIGN COMPLETE!")
+    lines.append("Ready to export datasets and begin training")
+    lines.append("=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
     return True
 
 
 if __name__ == "__main__":
+    install_uvloop()
     success = asyncio.run(run_distributed_campaign())
     sys.exit(0 if success else 1)
@@ -1,76 +1,190 @@
+import hashlib
+import logging
 import os
-import re
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+from hafs_scawful.scripts.routine_scanner import iter_routines, routine_code
+
+try:
+    import orjson  # Optional: faster serialization of the routine library
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Scanned-file interval between progress lines (per-file detail is DEBUG)
+PROGRESS_EVERY = 500
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
 
-class RoutineScanner:
-    def __init__(self, search_dirs: list[str]):
-        self.search_dirs = [Path(d) for d in search_dirs]
-        self.label_pattern = re.compile(r"^([A-Za-z0-9_]+):")
-        self.return_pattern = re.compile(r"\b(RTS|RTL|RTI)\b", re.IGNORECASE)
 
-    def scan_file(self, file_path: Path) -> list:
-        routines = []
-        if not file_path.exists():
-            return routines
+SOURCE_SUFFIXES = (".asm", ".s")
+# Skip common build or temp dirs (pruned by directory name)
+SKIP_DIRS = frozenset({"build", ".git"})
+# Larger .asm/.s files are generated dumps or mislabeled binaries
+MAX_SOURCE_BYTES = 50 * 1024 * 1024
 
-        current_routine = None
-        current_name = ""
-        
+
+def iter_source_files(root: str):
+    """Yield paths of non-empty assembly sources under root, without descending skipped dirs."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
         try:
-            with open(file_path, 'r', errors='replace') as f:
-                for line in f:
-                    stripped = line.strip()
-                    label_match = self.label_pattern.match(stripped)
-                    
-                    if label_match:
-                        if current_routine:
-                            routines.append({
-                                "name": current_name,
-                                "code": "\n".join(current_routine),
-                                "file": str(file_path.name)
-                            })
-                        
-                        current_name = label_match.group(1)
-                        current_routine = [line.rstrip()]
+            entries = os.scandir(directory)
+        except OSError as e:
+            # Unreadable directories are skipped, as Path.glob did
+            logger.warning(f"Skipping {directory}: {e}")
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(SOURCE_SUFFIXES):
+                    # Decide from directory metadata, before opening the file.
+                    # Symlinks are followed; dangling ones are skipped
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    if size == 0:
                         continue
-                    
-                    if current_routine is not None:
-                        current_routine.append(line.rstrip())
-                        
-                        if self.return_pattern.search(stripped):
-                            routines.append({
-                                "name": current_name,
-                                "code": "\n".join(current_routine),
-                                "file": str(file_path.name)
-                            })
-                            current_routine = None
-                            current_name = ""
-        except Exception as e:
-            print(f"Error scanning {file_path}: {e}")
-        
+                    if size > MAX_SOURCE_BYTES:
+                        logger.warning(f"Skipping {entry.path}: {size / 1e6:.0f} MB exceeds size cap")
+                        continue
+                    yield entry.path
+
+
+def scan_source_file(file_path) -> list:
+    """Scan one source file (str or Path); module-level so pool workers can run it."""
+    routines = []
+    path = os.fspath(file_path)
+    if not os.path.exists(path):
         return routines
 
-    def scan_all(self, output_path: str):
-        all_routines = []
+    file_name = os.path.basename(path)
+    try:
+        # Whole file as bytes, one combined label/return regex pass;
+        # routines are sliced out of the buffer and decoded once each
+        with open(path, 'rb') as f:
+            data = f.read()
+        for name, start, end in iter_routines(data):
+            routines.append({
+                "name": name,
+                "code": routine_code(data, start, end),
+                "file": file_name,
+            })
+    except Exception as e:
+        logger.warning(f"Error scanning {file_path}: {e}")
+
+    return routines
+
+
+def _scan_encoded(path: str) -> list[bytes]:
+    """Pool worker for scan_all: a file's routines as JSON {name, code, file}.
+
+    Encoding in the worker means the parent only ever handles bytes;
+    routine dicts and code strings never cross the process boundary.
+    """
+    return [_dumps(routine) for routine in scan_source_file(path)]
+
+
+def _scan_split(path: str) -> list[tuple[str, bytes, bytes]]:
+    """Pool worker for deduplicated scan_all output.
+
+    Returns (code hash, code JSON, occurrence JSON {name, file, hash}) per
+    routine, so the parent can write each unique body once.
+    """
+    split = []
+    for routine in scan_source_file(path):
+        code_hash = hashlib.blake2b(routine["code"].encode(), digest_size=8).hexdigest()
+        occurrence = {"name": routine["name"], "file": routine["file"], "hash": code_hash}
+        split.append((code_hash, _dumps(routine["code"]), _dumps(occurrence)))
+    return split
+
+
+class RoutineScanner:
+    def __init__(self, search_dirs: list[str], max_workers: Optional[int] = None):
+        self.search_dirs = [Path(d) for d in search_dirs]
+        self.max_workers = max_workers  # Scan processes (default: CPU count)
+
+    def scan_file(self, file_path) -> list:
+        """Scan one source file (str or Path)."""
+        return scan_source_file(file_path)
+
+    def _walk(self, seen: list):
+        """Yield source paths across all search dirs, recording each in seen."""
         for search_dir in self.search_dirs:
             if not search_dir.exists():
                 continue
-            print(f"Scanning directory: {search_dir}")
-            for ext in ['*.asm', '*.s']:
-                for file_path in search_dir.glob(f"**/{ext}"):
-                    # Skip common build or temp dirs
-                    if 'build' in str(file_path) or '.git' in str(file_path):
-                        continue
-                    routines = self.scan_file(file_path)
-                    all_routines.extend(routines)
-                    print(f"  Scanned {len(routines)} routines from {file_path.name}")
-        
-        with open(output_path, "w") as f:
-            json.dump(all_routines, f, indent=2)
-        print(f"Total routines saved to {output_path}: {len(all_routines)}")
+            logger.info(f"Scanning directory: {search_dir}")
+            for path in iter_source_files(str(search_dir)):
+                seen.append(path)
+                yield path
+
+    def scan_all(self, output_path: str, dedupe: bool = True):
+        """Scan every search dir into the master routine library JSON.
+
+        Without dedupe the output is a list of {name, code, file}. With
+        dedupe it is {"bodies": {hash: code}, "occurrences": [{name, file,
+        hash}]}: code shared by several files (e.g. the same routine in
+        usdasm and an Oracle fork) is stored once, and every occurrence
+        keeps its own name and file.
+        """
+        # Files are independent and the regex pass is CPU-bound: fan out.
+        # pool.map submits chunks while the walk is still listing
+        # directories, so workers read and scan files during the walk.
+        # Routines (or unique bodies) stream to disk one JSON element per line
+        paths: list[str] = []
+        occurrences: list[bytes] = []
+        seen_code: set[str] = set()
+        count = duplicates = 0
+        worker = _scan_split if dedupe else _scan_encoded
+        with open(output_path, "wb") as out, ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            results = pool.map(worker, self._walk(paths), chunksize=16)
+            out.write(b'{"bodies":{' if dedupe else b"[")
+            written = 0
+            for scanned, (path, encoded) in enumerate(zip(paths, results), 1):
+                for entry in encoded:
+                    count += 1
+                    if dedupe:
+                        code_hash, code, occurrence = entry
+                        occurrences.append(occurrence)
+                        if code_hash in seen_code:
+                            duplicates += 1
+                            continue
+                        seen_code.add(code_hash)
+                        entry = b'"%s":%s' % (code_hash.encode(), code)
+                    out.write(b",\n" if written else b"\n")
+                    out.write(entry)
+                    written += 1
+                logger.debug(f"Scanned {len(encoded)} routines from {os.path.basename(path)}")
+                if scanned % PROGRESS_EVERY == 0:
+                    logger.info(f"Scanned {scanned} files, {count} routines so far")
+            if dedupe:
+                out.write(b'\n},\n"occurrences":[\n')
+                out.write(b",\n".join(occurrences))
+                out.write(b"\n]}\n")
+            else:
+                out.write(b"\n]\n")
+        logger.info(
+            f"Total routines saved to {output_path}: {count} from {len(paths)} files "
+            f"({duplicates} share an already-stored body)"
+        )
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
     scanner = RoutineScanner([
         "/Users/scawful/Code/usdasm",
         "/Users/scawful/Code/Oracle-of-Secrets/Items",
@@ -2,11 +2,22 @@ import re
 import json
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster serialization of the symbol map
+except ImportError:
+    orjson = None
+
+# Matches: LABEL = $XXXXXX or LABEL = $XXXX (indentation allowed),
+# anchored per line so one findall covers the whole file
+SYMBOL_PATTERN = re.compile(
+    r"^[^\S\n]*([A-Za-z0-9_]+)[^\S\n]+=[^\S\n]+(\$[0-9A-Fa-f]+)", re.MULTILINE
+)
+
+
 class SymbolScanner:
     def __init__(self, ram_asm_path: str):
         self.ram_asm_path = Path(ram_asm_path)
-        # Matches: LABEL = $XXXXXX or LABEL = $XXXX
-        self.symbol_pattern = re.compile(r"^([A-Za-z0-9_]+)\s+=\s+(\$[0-9A-Fa-f]+)")
+        self.symbol_pattern = SYMBOL_PATTERN
 
     def scan(self) -> dict:
         symbol_map = {}
@@ -14,25 +25,24 @@ class SymbolScanner:
             print(f"Error: {self.ram_asm_path} not found.")
             return symbol_map
 
-        with open(self.ram_asm_path, 'r') as f:
-            for line in f:
-                match = self.symbol_pattern.match(line.strip())
-                if match:
-                    label, addr = match.groups()
-                    # Normalize to 24-bit if possible
-                    if len(addr) == 5: # $XXXX
-                        # Naive: assume $7E bank for RAM symbols if 16-bit
-                        # This is a common pattern in ALTTP disassembly
-                        full_addr = f"$7E{addr[1:]}"
-                        symbol_map[full_addr] = label
-                    
-                    symbol_map[addr.upper()] = label
-        
+        for label, addr in self.symbol_pattern.findall(self.ram_asm_path.read_text()):
+            addr = addr.upper()
+            # Normalize to 24-bit if possible
+            if len(addr) == 5: # $XXXX
+                # Naive: assume $7E bank for RAM symbols if 16-bit
+                # This is a common pattern in ALTTP disassembly
+                symbol_map[f"$7E{addr[1:]}"] = label
+
+            symbol_map[addr] = label
+
         return symbol_map
 
 if __name__ == "__main__":
     scanner = SymbolScanner("/Users/scawful/Code/Oracle-of-Secrets/Core/ram.asm")
     symbols = scanner.scan()
-    with open("symbols_map.json", "w") as f:
-        json.dump(symbols, f, indent=2)
+    with open("symbols_map.json", "wb") as f:
+        if orjson is not None:
+            f.write(orjson.dumps(symbols, option=orjson.OPT_INDENT_2))
+        else:
+            f.write(json.dumps(symbols, indent=2).encode())
     print(f"Scanned {len(symbols)} symbols.")
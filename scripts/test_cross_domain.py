@@ -8,6 +8,8 @@ from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
 ensure_hafs_on_path()
 
 from agents.training.cross_domain import CrossDomainGenerator
+from hafs_scawful.generators.cross_domain_pairing import pair_cross_domain
+from hafs_scawful.generators.oracle_generator import OracleDataGenerator
 from hafs_scawful.generators.zelda3_generator import Zelda3DisasmGenerator
 
 
@@ -30,19 +32,26 @@ async def main():
     print("Extracting vanilla ASM routines...")
     asm_items = await zelda3_gen.extract_source_items()
     print(f"Found {len(asm_items)} vanilla routines")
+
+    oracle_gen = OracleDataGenerator()
+    await oracle_gen.setup()
+    oracle_items = await oracle_gen.extract_source_items()
+    print(f"Found {len(oracle_items)} Oracle routines")
+
+    # Pair by canonical routine name (bucketed, not an all-pairs scan)
+    pairs = pair_cross_domain(asm_items, oracle_items, limit=1)
+    if not pairs and len(asm_items) >= 2:
+        pairs = [(asm_items[0], asm_items[1])]  # Simulated: two ASM items
     print()
 
-    if len(asm_items) >= 2:
-        # Test ASM+Oracle-style generation (simulated - just use two ASM items)
+    if pairs:
+        primary, secondary = pairs[0]
         print("Testing cross-domain generation...")
-        print(f"Primary: {asm_items[0].name}")
-        print(f"Secondary: {asm_items[1].name}")
+        print(f"Primary: {primary.name}")
+        print(f"Secondary: {secondary.name}")
         print()
 
-        sample = await cross_gen.generate_asm_oracle_pair(
-            asm_items[0],
-            asm_items[1],
-        )
+        sample = await cross_gen.generate_asm_oracle_pair(primary, secondary)
 
         if sample:
             print("✓ Successfully generated cross-domain sample!")
@@ -2,13 +2,22 @@
 """Test new models for training data generation.
 
 Compare DeepSeek-R1, Qwen3, Gemma3 against current baseline.
+
+Models are tested concurrently, HAFS_SWEEP_PARALLEL (default 3) at a time;
+as each finishes the next one starts. Timings then include queueing and
+model-swap contention and are reported as such; set HAFS_SWEEP_PARALLEL=1
+for clean per-model speeds. For Ollama to actually run them side by side,
+start it with OLLAMA_NUM_PARALLEL and OLLAMA_MAX_LOADED_MODELS at least that
+high; otherwise requests queue server-side.
 """
 
 import asyncio
 import os
+import sys
 from datetime import datetime
+from operator import itemgetter
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
+from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path, install_uvloop
 
 ensure_hafs_on_path()
 
@@ -19,27 +28,17 @@ from services.local_ai_orchestrator import (
 )
 
 
-async def test_model(model: str, test_prompt: str) -> dict:
+async def test_model(orch: LocalAIOrchestrator, model: str, test_prompt: str) -> dict:
     """Test a single model.
 
     Args:
+        orch: Started orchestrator shared by all tests
         model: Model name
         test_prompt: Test prompt
 
     Returns:
         Results dict with response, time, quality estimate
     """
-    print(f"\n{'='*80}")
-    print(f"Testing: {model}")
-    print(f"{'='*80}")
-
-    orch = LocalAIOrchestrator(
-        ollama_url=os.environ.get("OLLAMA_URL", "http://127.0.0.1:11434"),
-        default_model=model,
-    )
-
-    await orch.start()
-
     request = InferenceRequest(
         id=f"test_{model}_{datetime.now().timestamp()}",
         priority=RequestPriority.INTERACTIVE,
@@ -53,16 +52,18 @@ async def test_model(model: str, test_prompt: str) -> dict:
     result = await orch.submit_request(request)
     elapsed = (datetime.now() - start).total_seconds()
 
-    await orch.stop()
-
+    # Tests run concurrently: print each model's block in one go
+    lines = [f"\n{'='*80}", f"Testing: {model}", f"{'='*80}"]
     if result.error:
-        print(f"❌ Error: {result.error}")
+        lines.append(f"❌ Error: {result.error}")
+        print("\n".join(lines))
         return {"model": model, "error": result.error}
 
-    print(f"✓ Response ({elapsed:.1f}s):")
-    print(result.response[:500])
+    lines.append(f"✓ Response ({elapsed:.1f}s):")
+    lines.append(result.response[:500])
     if len(result.response) > 500:
-        print(f"... ({len(result.response)} total chars)")
+        lines.append(f"... ({len(result.response)} total chars)")
+    print("\n".join(lines))
 
     return {
         "model": model,
@@ -104,39 +105,72 @@ Provide a clear, technical explanation of:
 
 Keep your explanation concise but technically accurate."""
 
-    # Models to test
+    # Models to test: (name, description, estimated params in billions)
     models_to_test = [
         # Reasoning models
-        ("deepseek-r1:8b", "DeepSeek-R1 8B (Reasoning)"),
-        ("deepseek-r1:14b", "DeepSeek-R1 14B (Reasoning)"),
+        ("deepseek-r1:8b", "DeepSeek-R1 8B (Reasoning)", 8),
+        ("deepseek-r1:14b", "DeepSeek-R1 14B (Reasoning)", 14),
 
         # Latest generation
-        ("qwen3:14b", "Qwen 3 14B (Latest)"),
-        ("gemma3:12b", "Gemma 3 12B (Latest)"),
+        ("qwen3:14b", "Qwen 3 14B (Latest)", 14),
+        ("gemma3:12b", "Gemma 3 12B (Latest)", 12),
 
         # Current baseline
-        ("qwen2.5-coder:14b", "Qwen 2.5-Coder 14B (Current)"),
+        ("qwen2.5-coder:14b", "Qwen 2.5-Coder 14B (Current)", 14),
 
         # Code specialists
-        ("deepseek-coder:33b", "DeepSeek-Coder 33B"),
+        ("deepseek-coder:33b", "DeepSeek-Coder 33B", 33),
     ]
+    # Smallest (fastest) first, so early results print while big models run
+    models_to_test.sort(key=itemgetter(2))
+
+    raw_parallel = os.environ.get("HAFS_SWEEP_PARALLEL", "3")
+    try:
+        sweep_parallel = int(raw_parallel)
+        if sweep_parallel < 1:
+            # Semaphore(0) would never let a request start
+            raise ValueError
+    except ValueError:
+        print(f"❌ HAFS_SWEEP_PARALLEL must be an integer >= 1 (got {raw_parallel!r})")
+        return 1
 
-    results = []
+    print(f"\n\n{'#'*80}")
+    print(f"# Testing {len(models_to_test)} models, {sweep_parallel} at a time:")
+    for model, description, _ in models_to_test:
+        print(f"#   {description}")
+    print(f"{'#'*80}")
 
-    for model, description in models_to_test:
-        print(f"\n\n{'#'*80}")
-        print(f"# {description}")
-        print(f"{'#'*80}")
+    # One orchestrator (and HTTP client) for the whole sweep; each request
+    # names its model explicitly
+    orch = LocalAIOrchestrator(
+        ollama_url=os.environ.get("OLLAMA_URL", "http://127.0.0.1:11434"),
+        default_model=models_to_test[0][0],
+    )
+    sem = asyncio.Semaphore(sweep_parallel)
 
-        try:
-            result = await test_model(model, test_prompt)
-            results.append(result)
-        except Exception as e:
-            print(f"❌ Failed: {e}")
-            results.append({"model": model, "error": str(e)})
+    async def run(model: str) -> dict:
+        # Keep sweep_parallel requests in flight; a slow model only holds one slot
+        async with sem:
+            try:
+                return await test_model(orch, model, test_prompt)
+            except Exception as e:
+                print(f"❌ {model} failed: {e}")
+                return {"model": model, "error": str(e)}
 
-        # Brief pause between tests
-        await asyncio.sleep(2)
+    await orch.start()
+    results = []
+    try:
+        tasks = [asyncio.create_task(run(model)) for model, _, _ in models_to_test]
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            results.append(result)
+            if "error" not in result:
+                print(
+                    f"⚡ [{len(results)}/{len(tasks)}] {result['model']} "
+                    f"finished in {result['time_seconds']:.1f}s"
+                )
+    finally:
+        await orch.stop()
 
     # Summary
     print("\n\n" + "="*80)
@@ -152,7 +186,17 @@ Keep your explanation concise but technically accurate."""
     # Sort by speed
     successful.sort(key=lambda r: r["time_seconds"])
 
-    print("\n⚡ Speed Ranking:")
+    if sweep_parallel > 1:
+        # Times include Ollama queueing and model swaps caused by the other
+        # in-flight models, so rankings are not clean per-model speeds
+        print(
+            f"\n⚠ Timings measured with up to {sweep_parallel} models in flight "
+            "(includes queueing/model-swap time); rerun with "
+            "HAFS_SWEEP_PARALLEL=1 for clean speed rankings."
+        )
+        print("\n⚡ Speed Ranking (under contention):")
+    else:
+        print("\n⚡ Speed Ranking:")
     for i, r in enumerate(successful, 1):
         words_per_sec = r["length_words"] / r["time_seconds"]
         print(f"{i}. {r['model']:30s} {r['time_seconds']:6.1f}s  ({words_per_sec:.1f} words/sec)")
@@ -183,5 +227,6 @@ Keep your explanation concise but technically accurate."""
 
 
 if __name__ == "__main__":
+    install_uvloop()
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
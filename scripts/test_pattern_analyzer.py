@@ -5,7 +5,7 @@ import asyncio
 import os
 from pathlib import Path
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
+from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path, install_uvloop
 
 ensure_hafs_on_path()
 
@@ -62,20 +62,32 @@ async def main():
     print("Generating Expert Questions")
     print("=" * 80)
 
-    questions = []
-    for i, pattern in enumerate(top_patterns[:3], 1):
-        print(f"\n[{i}/3] Generating question for {pattern.pattern_type}...")
+    async def generate(i, pattern):
+        # Questions are generated concurrently; each prints one block when done
         question = await agent.generate_question(pattern)
-
+        lines = [f"\n[{i}/3] Question for {pattern.pattern_type}:"]
         if question:
-            questions.append(question)
-            print(f"✓ Generated: {question.question_id}")
-            print(f"  Type: {question.question_type}")
-            print(f"  Difficulty: {question.difficulty}")
-            print(f"  Priority: {question.priority_score:.2f}")
-            print(f"  Question: {question.question_text[:150]}...")
+            lines.append(f"✓ Generated: {question.question_id}")
+            lines.append(f"  Type: {question.question_type}")
+            lines.append(f"  Difficulty: {question.difficulty}")
+            lines.append(f"  Priority: {question.priority_score:.2f}")
+            lines.append(f"  Question: {question.question_text[:150]}...")
         else:
-            print(f"✗ Failed to generate question")
+            lines.append(f"✗ Failed to generate question")
+        print("\n".join(lines))
+        return question
+
+    print(f"\nGenerating questions for top {len(top_patterns[:3])} patterns...")
+    raw = await asyncio.gather(
+        *(generate(i, pattern) for i, pattern in enumerate(top_patterns[:3], 1)),
+        return_exceptions=True,
+    )
+    questions = []
+    for question in raw:
+        if isinstance(question, Exception):
+            print(f"✗ Question generation failed: {question}")
+        elif question:
+            questions.append(question)
 
     # Save questions
     if questions:
@@ -98,4 +110,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
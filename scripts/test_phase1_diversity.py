@@ -12,8 +12,14 @@ Measures diversity improvements and rejection rates.
 import asyncio
 import json
 import sys
+from operator import itemgetter
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
+try:
+    import orjson  # Optional: faster parsing of large rejection summaries
+except ImportError:
+    orjson = None
+
+from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path, install_uvloop
 
 ensure_hafs_on_path()
 
@@ -136,7 +142,7 @@ async def main():
         print("Domain Breakdown")
         print("=" * 80)
         print()
-        for domain, count in sorted(stats.domain_counts.items(), key=lambda x: x[1], reverse=True):
+        for domain, count in sorted(stats.domain_counts.items(), key=itemgetter(1), reverse=True):
             print(f"  {domain:20s}: {count:4d} samples")
         print()
 
@@ -157,18 +163,20 @@ async def main():
         # Check for rejection summary
         rejection_summary = result.output_dir / "rejection_summary.json"
         if rejection_summary.exists():
-            with open(rejection_summary) as f:
-                rej_data = json.load(f)
+            raw = rejection_summary.read_bytes()
+            rej_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            total_rejected = rej_data.get('total_rejected', 0)
 
             print("=" * 80)
             print("Rejection Analysis")
             print("=" * 80)
             print()
-            print(f"Total Rejected:      {rej_data.get('total_rejected', 0)}")
+            print(f"Total Rejected:      {total_rejected}")
             print()
             print("By Reason:")
-            for reason, count in sorted(rej_data.get('by_reason', {}).items(), key=lambda x: x[1], reverse=True):
-                pct = (count / rej_data['total_rejected'] * 100) if rej_data['total_rejected'] > 0 else 0
+            inv_total = (100.0 / total_rejected) if total_rejected > 0 else 0.0
+            for reason, count in sorted(rej_data.get('by_reason', {}).items(), key=itemgetter(1), reverse=True):
+                pct = count * inv_total
                 print(f"  {reason:30s}: {count:4d} ({pct:5.1f}%)")
             print()
 
@@ -186,4 +194,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
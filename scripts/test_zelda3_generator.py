@@ -3,7 +3,7 @@
 
 import asyncio
 
-from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path
+from hafs_scawful.scripts.bootstrap import ensure_hafs_on_path, install_uvloop
 
 ensure_hafs_on_path()
 
@@ -27,10 +27,11 @@ async def main():
         print("First 5 items:")
         for i, item in enumerate(items[:5], 1):
             print(f"{i}. {item.name} ({item.file_path})")
-            print(f"   Lines: {len(item.code.split(chr(10)))}")
+            print(f"   Lines: {item.code.count(chr(10)) + 1}")
             print(f"   Address: {item.address}")
             print()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
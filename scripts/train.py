@@ -11,6 +11,7 @@ Usage:
 """
 
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -27,10 +28,20 @@ except ImportError:
     import tomli as tomllib  # type: ignore
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(resolved_path: str, mtime_ns: int) -> dict:
+    with open(resolved_path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_config(config_path: Path) -> dict:
+    """Parse the training config, cached per path until the file's mtime changes."""
+    return _load_config_cached(str(config_path.resolve()), config_path.stat().st_mtime_ns)
+
+
 def list_presets(config_path: Path):
     """List available training presets."""
-    with open(config_path, "rb") as f:
-        config = tomllib.load(f)
+    config = load_config(config_path)
 
     print("Available Training Presets:")
     print("=" * 80)
@@ -47,8 +58,7 @@ def list_presets(config_path: Path):
 
 def list_experts(config_path: Path):
     """List available Oracle experts."""
-    with open(config_path, "rb") as f:
-        config = tomllib.load(f)
+    config = load_config(config_path)
 
     print("Available Oracle Experts:")
     print("=" * 80)
@@ -63,8 +73,7 @@ def list_experts(config_path: Path):
 
 def list_hardware(config_path: Path):
     """List available hardware profiles."""
-    with open(config_path, "rb") as f:
-        config = tomllib.load(f)
+    config = load_config(config_path)
 
     print("Available Hardware Profiles:")
     print("=" * 80)
@@ -108,6 +108,9 @@ try:
         torch_dtype=torch.float16 if device == "mps" else torch.float32,
         device_map=None,  # We'll move to device manually
         trust_remote_code=True,
+        # Build on the meta device and load weights straight from the
+        # (mmapped safetensors) checkpoint: no random init, no second copy
+        low_cpu_mem_usage=True,
     )
 
     # Add LoRA adapters
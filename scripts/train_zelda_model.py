@@ -144,6 +144,9 @@ try:
         torch_dtype=torch.float16 if device == "cuda" else torch.float32,
         device_map="auto" if device == "cuda" else None,
         trust_remote_code=True,
+        # Build on the meta device and load weights straight from the
+        # (mmapped safetensors) checkpoint: no random init, no second copy
+        low_cpu_mem_usage=True,
     )
 
     # Add LoRA adapters
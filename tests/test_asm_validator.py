@@ -0,0 +1,49 @@
+"""Tests for AsmValidator's worker-process offload."""
+
+import pytest
+
+from agents.training.base import TrainingSample
+from hafs_scawful.generators.prefilter import MAX_OUTPUT_CHARS, asm_prefilter_reason
+from hafs_scawful.validators import asm_validator
+from hafs_scawful.validators.asm_validator import AsmValidator
+
+
+def test_offload_threshold_below_prefilter_cap():
+    """Outputs the prefilter accepts must be able to reach the worker pool."""
+    assert AsmValidator.OFFLOAD_MIN_CHARS < MAX_OUTPUT_CHARS
+
+
+@pytest.mark.asyncio
+async def test_large_accepted_sample_parsed_in_worker(monkeypatch):
+    """A large sample that passes the prefilter is analyzed in a worker process."""
+    body = "    LDA #$01\n    STA $2100\n" * 400
+    sample = TrainingSample(
+        instruction="Explain this screen brightness setup loop.",
+        input="asm",
+        output=f"```asm\n{body}```\n",
+        domain="asm",
+        source="test",
+    )
+    assert asm_prefilter_reason(sample) is None
+    assert len(sample.output) >= AsmValidator.OFFLOAD_MIN_CHARS
+
+    monkeypatch.setattr(asm_validator, "_process_pool", None)
+    pool = asm_validator._get_process_pool()
+    submitted = []
+    real_submit = pool.submit
+
+    def spy_submit(fn, *args):
+        submitted.append(fn)
+        return real_submit(fn, *args)
+
+    monkeypatch.setattr(pool, "submit", spy_submit)
+    try:
+        validator = AsmValidator()
+        result = await validator.validate(sample)
+    finally:
+        pool.shutdown()
+
+    assert submitted == [asm_validator._analyze_in_worker]
+    assert result.valid is True
+    assert result.details["instructions_found"] == 800
+    assert result.details == validator._analyze(sample.output)[2]
@@ -0,0 +1,33 @@
+"""Tests for bucketed cross-domain pairing."""
+
+from types import SimpleNamespace
+
+from hafs_scawful.generators.cross_domain_pairing import (
+    canonical_routine_name,
+    pair_cross_domain,
+)
+
+
+def test_canonical_routine_name_strips_hack_affixes():
+    assert canonical_routine_name("Oracle_Sprite_Main_long") == "spritemain"
+    assert canonical_routine_name("Sprite_Main") == "spritemain"
+
+
+def test_pairs_only_within_matching_bucket():
+    vanilla = [
+        SimpleNamespace(name="a", label="Link_HandleSword"),
+        SimpleNamespace(name="b", label="Sprite_Main"),
+    ]
+    oracle = [
+        SimpleNamespace(name="NewSwordLogic", hooks_vanilla="Link_HandleSword", calls=[]),
+        SimpleNamespace(name="Oracle_Sprite_Main", hooks_vanilla=None, calls=[]),
+        SimpleNamespace(name="Unrelated", hooks_vanilla=None, calls=["Nothing"]),
+    ]
+
+    pairs = pair_cross_domain(vanilla, oracle)
+
+    assert [(a.name, o.name) for a, o in pairs] == [
+        ("a", "NewSwordLogic"),
+        ("b", "Oracle_Sprite_Main"),
+    ]
+    assert len(pair_cross_domain(vanilla, oracle, limit=1)) == 1
@@ -0,0 +1,52 @@
+"""Tests for the per-file SourceItemCache."""
+
+import os
+from dataclasses import dataclass, field
+
+from hafs_scawful.generators.source_cache import SourceItemCache
+
+
+@dataclass
+class FakeItem:
+    name: str = ""
+    labels: list[str] = field(default_factory=list)
+
+
+def test_cache_round_trip(tmp_path):
+    """Unchanged files are served from the cache after a save/load cycle."""
+    source = tmp_path / "bank00.asm"
+    source.write_text("Reset:\n  SEI\n")
+
+    cache = SourceItemCache("test", FakeItem, cache_dir=tmp_path)
+    cache.load()
+    key, items = cache.lookup(source)
+    assert items is None
+    cache.store(source, key, [FakeItem("Reset", ["NMI"])])
+    cache.save()
+
+    reloaded = SourceItemCache("test", FakeItem, cache_dir=tmp_path)
+    reloaded.load()
+    _, items = reloaded.lookup(source)
+    assert items == [FakeItem("Reset", ["NMI"])]
+    assert reloaded.hits == 1
+
+
+def test_cache_miss_on_modified_file(tmp_path):
+    """A changed mtime/size invalidates the cached entry."""
+    source = tmp_path / "bank00.asm"
+    source.write_text("Reset:\n")
+
+    cache = SourceItemCache("test", FakeItem, cache_dir=tmp_path)
+    key, _ = cache.lookup(source)
+    cache.store(source, key, [FakeItem("Reset")])
+    cache.save()
+
+    source.write_text("Reset:\n  SEI\n  CLC\n")
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    reloaded = SourceItemCache("test", FakeItem, cache_dir=tmp_path)
+    reloaded.load()
+    _, items = reloaded.lookup(source)
+    assert items is None
+    assert reloaded.misses == 1
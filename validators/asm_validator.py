@@ -10,13 +10,34 @@ Validates:
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
 from agents.training.base import TrainingSample
 from agents.training.validators.base import ValidationResult, Validator
 
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Shared worker pool for offloaded validation (created on first use)."""
+    global _process_pool
+    if _process_pool is None:
+        # forkserver avoids forking a parent that holds generator state;
+        # not available on Windows, where spawn is the only option
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _process_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context(method))
+    return _process_pool
+
+
+def _analyze_in_worker(code: str, strict: bool) -> tuple[list[str], list[str], dict]:
+    """Top-level (picklable) entry point for worker processes."""
+    return AsmValidator(strict=strict)._analyze(code)
+
 
 @dataclass
 class InstructionInfo:
@@ -114,6 +135,10 @@ class AsmValidator(Validator):
 
     VALID_DOMAINS = {"asm", "hack_curated"}
 
+    # Outputs at least this long are parsed in a worker process. Must stay
+    # below prefilter.MAX_OUTPUT_CHARS, or no prefiltered asm sample reaches it
+    OFFLOAD_MIN_CHARS = 8_000
+
     def __init__(self, strict: bool = False):
         """Initialize ASM validator.
 
@@ -129,6 +154,48 @@ class AsmValidator(Validator):
 
     async def validate(self, sample: TrainingSample) -> ValidationResult:
         """Validate 65816 assembly in the sample output."""
+        # Extract code from output
+        code = sample.output
+
+        # Parsing is pure CPU work; large outputs go to a worker process so
+        # they don't stall concurrent generation on the event loop
+        if len(code) >= self.OFFLOAD_MIN_CHARS:
+            loop = asyncio.get_running_loop()
+            errors, warnings, details = await loop.run_in_executor(
+                _get_process_pool(), _analyze_in_worker, code, self.strict
+            )
+        else:
+            errors, warnings, details = self._analyze(code)
+
+        if details["instructions_found"] == 0:
+            return ValidationResult(
+                valid=True,
+                score=0.5,
+                warnings=warnings,
+                details=details,
+            )
+
+        # Calculate score
+        score = details["valid_instructions"] / details["instructions_found"]
+
+        # Boost score if SNES-specific content found
+        if details["snes_registers_used"]:
+            score = min(1.0, score + 0.1)
+
+        return ValidationResult(
+            valid=len(errors) == 0,
+            score=score,
+            errors=errors,
+            warnings=warnings,
+            details=details,
+        )
+
+    def _analyze(self, code: str) -> tuple[list[str], list[str], dict]:
+        """Parse and check instructions in code.
+
+        Returns:
+            (errors, warnings, details) tuple; picklable for worker processes
+        """
         errors: list[str] = []
         warnings: list[str] = []
         details: dict = {
@@ -139,21 +206,13 @@ class AsmValidator(Validator):
             "addressing_modes": [],
         }
 
-        # Extract code from output
-        code = sample.output
-
         # Parse instructions
         instructions = self._extract_instructions(code)
         details["instructions_found"] = len(instructions)
 
         if len(instructions) == 0:
             warnings.append("No assembly instructions found in output")
-            return ValidationResult(
-                valid=True,
-                score=0.5,
-                warnings=warnings,
-                details=details,
-            )
+            return errors, warnings, details
 
         # Validate each instruction
         for line_num, instr in instructions:
@@ -178,23 +237,7 @@ class AsmValidator(Validator):
             if reg in code:
                 details["snes_registers_used"].append(reg)
 
-        # Calculate score
-        if details["instructions_found"] > 0:
-            score = details["valid_instructions"] / details["instructions_found"]
-        else:
-            score = 0.5
-
-        # Boost score if SNES-specific content found
-        if details["snes_registers_used"]:
-            score = min(1.0, score + 0.1)
-
-        return ValidationResult(
-            valid=len(errors) == 0,
-            score=score,
-            errors=errors,
-            warnings=warnings,
-            details=details,
-        )
+        return errors, warnings, details
 
     def _extract_instructions(self, code: str) -> list[tuple[int, str]]:
         """Extract assembly instructions from code.